@@ -0,0 +1,141 @@
+# Aim: To integrate smooth functions to machine precision with Gauss-Legendre and Clenshaw-Curtis quadrature, with cached nodes and weights and many integrals evaluated as one matrix-vector product
+import numpy as np
+import matplotlib.pyplot as plt
+import os
+import time
+from functools import lru_cache
+
+# Node and weight tables are stored here after their first computation
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+RULES = ('gauss', 'clenshaw_curtis')
+
+def gauss_legendre_rule(n):
+    """n Gauss-Legendre nodes and weights on [-1, 1]; exact for polynomials of degree 2n - 1."""
+    return np.polynomial.legendre.leggauss(n)
+
+def clenshaw_curtis_rule(n):
+    """
+    n + 1 Clenshaw-Curtis nodes cos(k pi / n) and weights on [-1, 1], from the
+    explicit cosine-sum formula. Exact for polynomials of degree n. The
+    rule with 2n points reuses every node of the rule with n points.
+    """
+    if n < 1:
+        raise ValueError("Clenshaw-Curtis needs n >= 1")
+    k = np.arange(n + 1)
+    nodes = np.cos(np.pi * k / n)
+    j = np.arange(1, n // 2 + 1)
+    b = np.where(2 * j == n, 1.0, 2.0)
+    c = np.where((k == 0) | (k == n), 1.0, 2.0)
+    weights = c / n * (1 - np.cos(2 * np.pi * np.outer(k, j) / n) @ (b / (4 * j**2 - 1)))
+    return nodes, weights
+
+@lru_cache(maxsize=64)
+def quadrature_rule(n, rule='gauss', cache_dir=CACHE_DIR):
+    """
+    Nodes and weights on [-1, 1] for the given rule and order. Each table is
+    computed once, saved to cache_dir/<rule>_<n>.npz and then kept in an
+    in-memory LRU cache. The returned arrays are read-only because every
+    caller shares them.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown rule {rule!r}; choose from {RULES}")
+    path = os.path.join(cache_dir, f'{rule}_{n}.npz')
+    if os.path.exists(path):
+        with np.load(path) as table:
+            nodes, weights = table['nodes'], table['weights']
+    else:
+        nodes, weights = gauss_legendre_rule(n) if rule == 'gauss' else clenshaw_curtis_rule(n)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, nodes=nodes, weights=weights)
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+def quadrature(f, a, b, n=32, rule='gauss'):
+    """Integral of a vectorized f over [a, b] with an n-point (Clenshaw-Curtis: n + 1) rule."""
+    nodes, weights = quadrature_rule(n, rule)
+    half = (b - a) / 2
+    return half * (f(half * nodes + (a + b) / 2) @ weights)
+
+def batch_quadrature(f, a, b, n=32, rule='gauss'):
+    """
+    Many integrals at once. a and b are arrays of interval ends (any matching
+    shape, m intervals in total). f maps nodes of shape (m, n) to values
+    of the same shape, so f can carry per-integral parameters by
+    broadcasting. The integrals are then the single matrix-vector product
+    F @ weights, scaled by each half-length.
+    """
+    nodes, weights = quadrature_rule(n, rule)
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    half = ((b - a) / 2).reshape(-1, 1)
+    centre = ((a + b) / 2).reshape(-1, 1)
+    values = f(half * nodes + centre)
+    return (half[:, 0] * (values @ weights)).reshape(a.shape)
+
+def converge_quadrature(f, a, b, tol=1e-13, rule='gauss', n_start=4, n_max=4096):
+    """
+    Doubles n (up to n_max) until two successive estimates agree to tol
+    (relative). Returns the last estimate, the n that produced it and the
+    total integrand evaluations; if tol is never met, that is the n_max
+    estimate.
+    """
+    n = n_start
+    estimate = quadrature(f, a, b, n, rule)
+    calls = quadrature_rule(n, rule)[0].size
+    while n < n_max:
+        n_next = min(2 * n, n_max)
+        refined = quadrature(f, a, b, n_next, rule)
+        calls += quadrature_rule(n_next, rule)[0].size
+        converged = abs(refined - estimate) <= tol * max(1.0, abs(refined))
+        estimate, n = refined, n_next
+        if converged:
+            break
+    return estimate, n, calls
+
+def convergence_table(f, a, b, exact, n_values=(2, 4, 8, 16, 32, 64)):
+    """Error of each rule at each order, printed and returned as {rule: errors}."""
+    print(f"{'n':>6}" + "".join(f"{rule:>18}" for rule in RULES))
+    errors = {rule: [] for rule in RULES}
+    for n in n_values:
+        for rule in RULES:
+            errors[rule].append(abs(quadrature(f, a, b, n, rule) - exact))
+        print(f"{n:>6}" + "".join(f"{errors[rule][-1]:>18.2e}" for rule in RULES))
+    return errors
+
+if __name__ == "__main__":
+    # Integrals with known values
+    print("--- Convergence on exp(x) over [0, 1] ---")
+    convergence_table(np.exp, 0, 1, np.e - 1)
+    print("\n--- Convergence on 1 / (1 + 25 x^2) over [-1, 1] (Runge function) ---")
+    errors = convergence_table(lambda x: 1 / (1 + 25 * x**2), -1, 1, 2 / 5 * np.arctan(5), n_values=(8, 16, 32, 64, 128))
+
+    # A million integrals of exp(c x) over [0, b], each with its own c and b, in one matrix-vector product
+    m = 10**6
+    rng = np.random.default_rng(0)
+    c = rng.uniform(-2, 2, m).reshape(-1, 1)
+    upper = rng.uniform(0.5, 2, m)
+    start = time.perf_counter()
+    values = batch_quadrature(lambda x: np.exp(c * x), np.zeros(m), upper, n=16)
+    elapsed = time.perf_counter() - start
+    exact = np.expm1(c[:, 0] * upper) / c[:, 0]
+    print(f"\n{m:,} integrals of exp(c x) in {elapsed:.2f} s, max relative error {np.max(np.abs(values / exact - 1)):.1e}")
+
+    start = time.perf_counter()
+    quadrature_rule.cache_clear()
+    quadrature_rule(1000, 'gauss')
+    disk = time.perf_counter() - start
+    start = time.perf_counter()
+    quadrature_rule(1000, 'gauss')
+    memory = time.perf_counter() - start
+    print(f"1000-point Gauss-Legendre table: {disk * 1e3:.2f} ms from disk or fresh, {memory * 1e6:.1f} µs from memory")
+
+    plt.figure()
+    for rule in RULES:
+        plt.semilogy((8, 16, 32, 64, 128), np.maximum(errors[rule], 1e-17), marker='o', label=rule)
+    plt.xlabel("Order n")
+    plt.ylabel("Absolute Error")
+    plt.title("Runge function: Gauss-Legendre vs Clenshaw-Curtis")
+    plt.legend()
+    plt.grid(True, which="both", ls="--")
+    plt.show()
@@ -17,6 +17,14 @@ while True:
     total_time = float(input("Enter the total time to simulate (default 30.0): ") or 30.0)        # Total time to simulate
     frames = int(input("Enter the number of animation frames (default 200): ") or 200)             # Animation frames
     num_simulations = int(input("Enter the number of Monte Carlo trials per frame (default 500): ") or 500)    # Monte Carlo trials per frame
+    generator = input("Random number generator: numpy, lagged or midsquare (default numpy): ").strip().lower() or 'numpy'
+    while generator not in ('numpy', 'lagged', 'midsquare'):
+        generator = input("Please enter numpy, lagged or midsquare: ").strip().lower() or 'numpy'
+    if generator == 'numpy':
+        rng = None
+    else:
+        from PRNG import HomegrownBitGenerator
+        rng = HomegrownBitGenerator.from_mid_square() if generator == 'midsquare' else HomegrownBitGenerator.from_lagged_fibonacci()
 
     # ---------------- Physics helpers ----------------
     def exact_method(N0, lambd, t):
@@ -25,9 +33,11 @@ while True:
         N_daughter = N0 - N_parent
         return N_parent, N_daughter
 
-    def monte_carlo_method(N0, lambd, t, num_simulations):
-        """Average remaining parents/daughters at time t using Monte Carlo."""
-        decay_times = np.random.exponential(1 / lambd, (num_simulations, N0))
+    def monte_carlo_method(N0, lambd, t, num_simulations, rng=None):
+        """Average remaining parents/daughters at time t using Monte Carlo.
+        rng may be a numpy Generator or a PRNG.HomegrownBitGenerator."""
+        rng = np.random if rng is None else rng
+        decay_times = rng.exponential(1 / lambd, (num_simulations, N0))
         decayed = np.sum(decay_times <= t, axis=1)
         return N0 - decayed.mean(), decayed.mean()
 
@@ -65,7 +75,7 @@ while True:
     # ---------------- Update function ----------------
     def update(frame):
         t = total_time * frame / (frames - 1)
-        p_mc, d_mc = monte_carlo_method(N0, lambd, t, num_simulations)
+        p_mc, d_mc = monte_carlo_method(N0, lambd, t, num_simulations, rng)
 
         times.append(t)
         parents_mc.append(p_mc)
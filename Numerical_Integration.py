@@ -3,6 +3,8 @@ import numpy as np
 import scipy.integrate as spi
 import matplotlib.pyplot as plt
 import os
+import time
+from Gaussian_Quadrature import quadrature, batch_quadrature, converge_quadrature, RULES
 
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -59,6 +61,168 @@ while True:
         L = 2 * integral
         return L
 
+    # ========================
+    # (4) Romberg Integration
+    # ========================
+
+    def romberg(h, a, tol=1e-10, max_levels=25):
+        """
+        Romberg integration to an absolute tolerance on L. Each level halves the
+        step of the trapezoidal rule and evaluates only the new midpoints;
+        T(dx/2) = T(dx)/2 + dx/2 * sum(new points). Richardson extrapolation
+        then builds the next row of the table.
+        Returns L, the number of integrand evaluations and the Romberg table.
+        """
+        f_ends = integrand(np.array([0.0, a]), h, a)
+        calls = 2
+        R = [[a * (f_ends[0] + f_ends[1]) / 2]]
+        for k in range(1, max_levels):
+            dx = a / 2**k
+            f_new = integrand(dx * (2 * np.arange(2**(k - 1)) + 1), h, a)
+            calls += f_new.size
+            row = [R[-1][0] / 2 + dx * np.sum(f_new)]
+            for j in range(1, k + 1):
+                row.append(row[j-1] + (row[j-1] - R[-1][j-1]) / (4**j - 1))
+            R.append(row)
+            if k >= 2 and 2 * abs(row[-1] - R[-2][-1]) <= tol:
+                break
+        return 2 * R[-1][-1], calls, R
+
+    # ========================
+    # (5) Adaptive Simpson's Rule
+    # ========================
+
+    def adaptive_simpson(h, a, tol=1e-10, max_depth=50):
+        """
+        Adaptive Simpson's rule to an absolute tolerance on L, refining all
+        unfinished intervals together. Each round evaluates the two quarter
+        points of every active interval in one integrand call. An interval is
+        accepted when |S(left) + S(right) - S(whole)| <= 15 * its share of
+        the tolerance, with the Richardson correction added. The others are
+        split, each half keeping the three values it already has.
+        Returns L and the number of integrand evaluations.
+        """
+        lo, hi = np.array([0.0]), np.array([a])
+        f_lo, f_mid, f_hi = (np.array([v]) for v in integrand(np.array([0.0, a / 2, a]), h, a))
+        calls = 3
+        whole = (hi - lo) / 6 * (f_lo + 4 * f_mid + f_hi)
+        eps = np.array([tol / 2])  # L = 2 * integral
+        total = 0.0
+        for depth in range(max_depth):
+            mid = (lo + hi) / 2
+            f_quarters = integrand(np.concatenate([(lo + mid) / 2, (mid + hi) / 2]), h, a)
+            calls += f_quarters.size
+            f_lq, f_rq = np.split(f_quarters, 2)
+            left = (mid - lo) / 6 * (f_lo + 4 * f_lq + f_mid)
+            right = (hi - mid) / 6 * (f_mid + 4 * f_rq + f_hi)
+            delta = left + right - whole
+            done = (np.abs(delta) <= 15 * eps) | (depth == max_depth - 1)
+            total += np.sum((left + right + delta / 15)[done])
+            split = ~done
+            if not split.any():
+                break
+            lo, hi = np.r_[lo[split], mid[split]], np.r_[mid[split], hi[split]]
+            f_lo, f_mid, f_hi = (np.r_[f_lo[split], f_mid[split]], np.r_[f_lq[split], f_rq[split]],
+                                 np.r_[f_mid[split], f_hi[split]])
+            whole = np.r_[left[split], right[split]]
+            eps = np.r_[eps[split], eps[split]] / 2
+        return 2 * total, calls
+
+    def fixed_rule_calls(rule, n):
+        """Integrand evaluations made by one call of a fixed-n rule (after its n adjustment)."""
+        if rule is simpsons_one_third_rule and n % 2 == 1:
+            n += 1
+        elif rule is simpsons_three_eighth_rule and n % 3 != 0:
+            n += 3 - (n % 3)
+        return n + 1
+
+    def Efficiency_Report(h, a, exact_L, tolerances=(1e-4, 1e-6, 1e-8, 1e-10, 1e-12)):
+        """
+        Integrand evaluations needed to reach each tolerance. The fixed-n
+        rules get the smallest power-of-two n that succeeds, so their count
+        is a lower bound. The Error_Plot sweep spends the sum over all the
+        n values it tries, because it re-evaluates a fresh grid for each n.
+        """
+        rules = [("Trapezoidal", trapezoidal_rule), ("Simpson's 1/3", simpsons_one_third_rule),
+                 ("Simpson's 3/8", simpsons_three_eighth_rule)]
+        print(f"{'Tolerance':>10}{'Romberg':>10}{'Adaptive':>10}" + "".join(f"{name:>15}" for name, _ in rules))
+        curves = {name: ([], []) for name in ["Romberg", "Adaptive Simpson"] + [name for name, _ in rules]}
+        for tol in tolerances:
+            L_rom, calls_rom, _ = romberg(h, a, tol)
+            L_ad, calls_ad = adaptive_simpson(h, a, tol)
+            row = f"{tol:>10.0e}{calls_rom:>10}{calls_ad:>10}"
+            for name, value, calls in (("Romberg", L_rom, calls_rom), ("Adaptive Simpson", L_ad, calls_ad)):
+                curves[name][0].append(calls)
+                curves[name][1].append(Error(exact_L, value))
+            for name, rule in rules:
+                n = next((2**i for i in range(1, 23) if Error(exact_L, rule(h, a, 2**i)) <= tol), None)
+                row += f"{fixed_rule_calls(rule, n) if n else '> 4M':>15}"
+            print(row)
+        for name, rule in rules:
+            n_values = [2**i for i in range(1, 15)]
+            curves[name][0].extend(fixed_rule_calls(rule, n) for n in n_values)
+            curves[name][1].extend(Error(exact_L, rule(h, a, n)) for n in n_values)
+
+        plt.figure()
+        for name, (calls, errors) in curves.items():
+            plt.loglog(calls, np.maximum(errors, 1e-16), marker='o', label=name)
+        plt.xlabel("Integrand Evaluations")
+        plt.ylabel("Absolute Error")
+        plt.title("Error against Integrand Evaluations")
+        plt.legend()
+        plt.grid(True, which="both", ls="--")
+        plt.show()
+
+    # ========================
+    # (6) Gauss-Legendre and Clenshaw-Curtis
+    # ========================
+
+    def Gaussian_Report(h, a, exact_L, n_designs=200):
+        """
+        Cable length with Gauss-Legendre and Clenshaw-Curtis rules against
+        Simpson's 1/3 rule, evaluations needed for 1e-13, and the lengths of
+        an n_designs x n_designs grid of (h, a) tower designs in one batched
+        matrix-vector product.
+        """
+        length = lambda n, rule: 2 * quadrature(lambda x: integrand(x, h, a), 0, a, n, rule)
+        n_values = [2, 4, 8, 16, 32, 64]
+        print(f"{'n':>6}{'Gauss-Legendre':>18}{'Clenshaw-Curtis':>18}{'Simpson 1/3':>18}")
+        errors = {rule: [Error(exact_L, length(n, rule)) for n in n_values] for rule in RULES}
+        errors['simpson'] = [Error(exact_L, simpsons_one_third_rule(h, a, n)) for n in n_values]
+        for i, n in enumerate(n_values):
+            print(f"{n:>6}{errors['gauss'][i]:>18.2e}{errors['clenshaw_curtis'][i]:>18.2e}{errors['simpson'][i]:>18.2e}")
+        for rule in RULES:
+            L, n, calls = converge_quadrature(lambda x: integrand(x, h, a), 0, a, 1e-13, rule)
+            print(f"{rule}: converged at n = {n} with {calls} evaluations, error {Error(exact_L, 2 * L):.1e}")
+
+        # Every (h, a) design at once: the integrand broadcasts over the per-row parameters
+        H, A = np.meshgrid(np.linspace(5, 40, n_designs), np.linspace(40, 200, n_designs))
+        start = time.perf_counter()
+        L_grid = 2 * batch_quadrature(lambda x: integrand(x, H.reshape(-1, 1), A.reshape(-1, 1)), 0, A, n=32)
+        batch_time = time.perf_counter() - start
+        sample = np.random.default_rng(0).choice(H.size, 100, replace=False)
+        start = time.perf_counter()
+        L_quad = np.array([exact_length(H.flat[i], A.flat[i]) for i in sample])
+        quad_time = (time.perf_counter() - start) * H.size / sample.size
+        print(f"{H.size:,} designs in {batch_time:.3f} s (scipy quad one by one: about {quad_time:.1f} s), "
+              f"max difference {np.max(np.abs(L_grid.flat[sample] - L_quad)):.1e} m")
+
+        fig, ax = plt.subplots(1, 2, figsize=(13, 5), constrained_layout=True)
+        for key, label, marker in (('gauss', 'Gauss-Legendre', 'o'), ('clenshaw_curtis', 'Clenshaw-Curtis', 's'),
+                                   ('simpson', "Simpson's 1/3", '^')):
+            ax[0].semilogy(n_values, np.maximum(errors[key], 1e-16), marker=marker, label=label)
+        ax[0].set_xlabel("Order n")
+        ax[0].set_ylabel("Absolute Error")
+        ax[0].set_title("Cable Length Error")
+        ax[0].legend()
+        ax[0].grid(True, which="both", ls="--")
+        contour = ax[1].contourf(A, H, L_grid, levels=20)
+        fig.colorbar(contour, ax=ax[1], label="Cable Length L (m)")
+        ax[1].set_xlabel("Half Span a (m)")
+        ax[1].set_ylabel("Tower Height h (m)")
+        ax[1].set_title(f"{H.size:,} Designs in One Batched Quadrature")
+        plt.show()
+
     def Error(f_exact, f_approx):
         return abs(f_exact - f_approx)
     
@@ -185,11 +349,17 @@ while True:
         print("Choose Plot: ")
         print("1. Plot all methods")
         print("2. Error Plot")
+        print("3. Romberg and Adaptive Simpson (evaluations to reach a tolerance)")
+        print("4. Gauss-Legendre and Clenshaw-Curtis Quadrature")
         choice =  int(input("Enter choice: "))
         if choice == 1:
             Plot_All_Rules(h, a, n)
         elif choice == 2:
             Error_Plot(h, a, n_values, exact_L)
+        elif choice == 3:
+            Efficiency_Report(h, a, exact_L)
+        elif choice == 4:
+            Gaussian_Report(h, a, exact_L)
         else:
             print("Invalid choice. Please try again.")
     m = (int)(input("Enter '1' for input and '0' to break the operation: "))
@@ -1,29 +1,87 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import random
+import itertools
+import os
+import time
+import ctypes
+import threading
+from functools import lru_cache
+from scipy import stats
 
-# Use a style for better-looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
+# Precomputed tables (e.g. Mid-Square cycle tables) are stored here
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
 
 # --- Generator Functions (Copied from your original script) ---
 
-def mid_square_method(seed, n_digits=4, n=10):
+def mid_square_step(x, n_digits=4):
+    """
+    One Mid-Square step with integer arithmetic only.
+    Keeps the same digits as slicing the square zero-padded to 2*n_digits
+    characters, i.e. the middle 2*(n_digits//2) digits. Works on Python ints
+    and elementwise on numpy int64 arrays (n_digits <= 9, so x*x fits).
+    """
+    return (x * x) // 10**(n_digits - n_digits // 2) % 10**(2 * (n_digits // 2))
+
+def mid_square_method(seed, n_digits=4, n=10, min_length=None):
     """
     Your original Mid-Square Method.
+    If min_length is given, seeds that collapse to zero or produce fewer than
+    min_length distinct values are refused (see check_mid_square_seed).
     """
+    if min_length is not None:
+        check_mid_square_seed(seed, n_digits, min_length)
     results = []
     x = seed
     for _ in range(n):
-        sq = x * x
-        sq_str = str(sq).zfill(2 * n_digits)
-        mid = len(sq_str) // 2
-        next_x = int(sq_str[mid - n_digits//2 : mid + n_digits//2])
+        next_x = mid_square_step(x, n_digits)
         results.append(next_x)
         x = next_x
         if x == 0:
             break
     return results
 
+def mid_square_vectorized(seeds, n_digits=4, n=10, keep_values=True):
+    """
+    Mid-Square Method advancing many seeds in lockstep.
+
+    Returns (values, collapse_step): values has shape (n, len(seeds)), one column
+    per seed, and collapse_step[s] is the index of the first 0 produced by seed
+    s (-1 if it never collapsed). Like mid_square_method, a collapsed seed
+    produces nothing after its 0, so values past collapse_step are 0.
+    With keep_values=False only the current state is held (values is None),
+    so memory stays O(len(seeds)) however many steps are taken.
+    """
+    x = np.array(seeds, dtype=np.int64).ravel()
+    values = np.zeros((n, x.size), dtype=np.int64) if keep_values else None
+    collapse_step = np.full(x.size, -1, dtype=np.int64)
+    alive = np.ones(x.size, dtype=bool)
+    for i in range(n):
+        x = mid_square_step(x, n_digits)
+        if keep_values:
+            values[i] = x
+        newly_dead = alive & (x == 0)
+        collapse_step[newly_dead] = i
+        alive &= ~newly_dead
+        if not alive.any():
+            break
+    return values, collapse_step
+
+def survey_mid_square_seeds(n_digits=4, n=100):
+    """
+    Run every seed in [0, 10**n_digits) for n steps in one vectorized pass
+    and summarise how many collapse to zero and how fast.
+    """
+    seeds = np.arange(10**n_digits, dtype=np.int64)
+    _, collapse_step = mid_square_vectorized(seeds, n_digits=n_digits, n=n, keep_values=False)
+    collapsed = collapse_step >= 0
+    print(f"Mid-Square survey: {seeds.size:,} seeds, {n_digits} digits, {n} steps")
+    print(f"Collapsed to zero: {collapsed.sum():,} ({collapsed.mean() * 100:.2f}%)")
+    if collapsed.any():
+        print(f"Steps to collapse: mean={collapse_step[collapsed].mean():.2f}, "
+              f"max={collapse_step[collapsed].max()}")
+    return collapse_step
+
 def lagged_fibonacci_generator(seed_list, m, n=10):
     """
     Your original Lagged Fibonacci (standard j=1, k=2).
@@ -47,6 +105,270 @@ def general_fibonacci_generator(seed_list, j, k, m, n=10):
         results.append(x_next)
     return results
 
+def mid_square_cycles(n_digits=4):
+    """
+    Transient length and period of the Mid-Square sequence for every seed in
+    [0, 10**n_digits), using Floyd's cycle detection run on all seeds at once.
+
+    Returns (transient, period, entry): seed s reaches its cycle after
+    transient[s] steps, the cycle has length period[s] and is entered at the
+    value entry[s] (entry 0 means the seed collapses to zero).
+    """
+    n_seeds = 10**n_digits
+    dtype = np.int32 if n_seeds < 2**31 else np.int64
+    seeds = np.arange(n_seeds, dtype=dtype)
+    succ = mid_square_step(seeds.astype(np.int64), n_digits).astype(dtype)
+
+    # Phase 1: tortoise moves one step, hare two, until they meet on the cycle
+    tortoise = succ[seeds]
+    hare = succ[tortoise]
+    active = np.flatnonzero(tortoise != hare)
+    while active.size:
+        tortoise[active] = succ[tortoise[active]]
+        hare[active] = succ[succ[hare[active]]]
+        active = active[tortoise[active] != hare[active]]
+
+    # Phase 2: restart the tortoise at the seed; they meet at the cycle entry
+    transient = np.zeros(n_seeds, dtype=dtype)
+    tortoise = seeds.copy()
+    active = np.flatnonzero(tortoise != hare)
+    while active.size:
+        tortoise[active] = succ[tortoise[active]]
+        hare[active] = succ[hare[active]]
+        transient[active] += 1
+        active = active[tortoise[active] != hare[active]]
+
+    # Phase 3: walk once around the cycle to measure its length
+    period = np.ones(n_seeds, dtype=dtype)
+    hare = succ[tortoise]
+    active = np.flatnonzero(hare != tortoise)
+    while active.size:
+        hare[active] = succ[hare[active]]
+        period[active] += 1
+        active = active[hare[active] != tortoise[active]]
+
+    return transient, period, tortoise
+
+@lru_cache(maxsize=4)
+def load_cycle_table(n_digits=4, cache_dir=CACHE_DIR):
+    """
+    Mid-Square cycle table for n_digits, computed once, saved to
+    cache_dir/mid_square_cycles_<n_digits>.npz and then kept in an in-memory
+    LRU cache. The returned arrays are read-only because every caller
+    shares them.
+    """
+    path = os.path.join(cache_dir, f'mid_square_cycles_{n_digits}.npz')
+    if os.path.exists(path):
+        with np.load(path) as table:
+            transient, period, entry = table['transient'], table['period'], table['entry']
+    else:
+        transient, period, entry = mid_square_cycles(n_digits)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez_compressed(path, transient=transient, period=period, entry=entry)
+    for array in (transient, period, entry):
+        array.setflags(write=False)
+    return transient, period, entry
+
+def check_mid_square_seed(seed, n_digits=4, min_length=100):
+    """
+    Raise ValueError if a seed collapses to zero or produces fewer than
+    min_length distinct values before repeating. After the first call for
+    n_digits the table is in memory, so each check is one array lookup.
+    """
+    transient, period, entry = load_cycle_table(n_digits)
+    if not 0 <= seed < transient.size:
+        raise ValueError(f"Seed {seed} is outside [0, {transient.size})")
+    if entry[seed] == 0:
+        raise ValueError(f"Seed {seed} collapses to zero after {transient[seed]} steps")
+    if transient[seed] + period[seed] < min_length:
+        raise ValueError(f"Seed {seed} repeats after {transient[seed] + period[seed]} values "
+                         f"(transient {transient[seed]}, period {period[seed]}), "
+                         f"fewer than {min_length}")
+
+def period_sweep(max_digits=6):
+    """Tabulate transient and period statistics over all seeds for 2..max_digits digits."""
+    print(f"{'Digits':>6}{'Seeds':>12}{'Max period':>12}{'Mean period':>13}"
+          f"{'Mean transient':>16}{'Max length':>12}{'To zero':>10}{'Time (s)':>10}")
+    rows = []
+    for n_digits in range(2, max_digits + 1):
+        start = time.perf_counter()
+        transient, period, entry = load_cycle_table(n_digits)
+        elapsed = time.perf_counter() - start
+        length = transient + period
+        to_zero = np.mean(entry == 0) * 100
+        print(f"{n_digits:>6}{transient.size:>12,}{period.max():>12}{period.mean():>13.2f}"
+              f"{transient.mean():>16.2f}{length.max():>12}{to_zero:>9.1f}%{elapsed:>10.2f}")
+        rows.append((n_digits, period.max(), period.mean(), transient.mean(), length.max(), to_zero))
+    return rows
+
+# --- Jump-ahead for the Fibonacci Generators ---
+
+def _matmul_mod(A, B, m):
+    """Exact (A @ B) % m for uint64 matrices with entries in [0, m)."""
+    if m & (m - 1) == 0:
+        # uint64 products and sums wrap mod 2**64, which m divides
+        C = A @ B
+        return C if m == 2**64 else C & np.uint64(m - 1)
+    if m > 2**32:
+        raise ValueError("Jump-ahead needs m to be a power of two or at most 2**32")
+    # Split A into 16-bit limbs so no partial sum overflows 64 bits
+    m64 = np.uint64(m)
+    high = (((A >> np.uint64(16)) @ B) % m64) * np.uint64(2**16) % m64
+    low = ((A & np.uint64(0xFFFF)) @ B) % m64
+    return (high + low) % m64
+
+def fibonacci_companion_matrix(j, k, m):
+    """
+    Companion matrix C of x[i] = (x[i-j] + x[i-k]) % m acting on the state
+    (x[i-k], ..., x[i-1]): C @ state gives the state one step later.
+    """
+    C = np.zeros((k, k), dtype=np.uint64)
+    C[np.arange(k - 1), np.arange(1, k)] = 1
+    C[k - 1, k - j] += 1
+    C[k - 1, 0] += 1
+    return C % np.uint64(m) if m < 2**64 else C
+
+@lru_cache(maxsize=4)
+def fibonacci_jump_matrix(j, k, m, n_steps):
+    """
+    C**n_steps mod m by repeated squaring. Only the current square is held
+    while it runs. The result is kept in a small LRU cache keyed on
+    (j, k, m, n_steps), so repeated jumps by the same stride cost one
+    matrix-vector product; it is read-only because callers share it.
+    """
+    square = fibonacci_companion_matrix(j, k, m)
+    result = None
+    while n_steps:
+        if n_steps & 1:
+            result = square if result is None else _matmul_mod(square, result, m)
+        n_steps >>= 1
+        if n_steps:
+            square = _matmul_mod(square, square, m)
+    result = np.eye(k, dtype=np.uint64) if result is None else result
+    result.setflags(write=False)
+    return result
+
+def fibonacci_jump(seed_list, j, k, m, n_steps):
+    """
+    The k values following the first n_steps of general_fibonacci_generator,
+    i.e. general_fibonacci_generator(seed_list, j, k, m, n)[n_steps:n_steps + k]
+    for any large enough n, without generating the values in between.
+    """
+    state = np.array([v % m for v in seed_list], dtype=np.uint64)
+    M = fibonacci_jump_matrix(j, k, m, n_steps)
+    return [int(v) for v in _matmul_mod(M, state[:, None], m)[:, 0]]
+
+def verify_jump_ahead():
+    """Check jump-ahead and substreams against sequential generation."""
+    for j, k, m in [(1, 2, 100), (3, 5, 100), (24, 55, 2**32), (24, 55, 2**64), (5, 17, 10**9 + 7)]:
+        seeds = [(7 * i + 3) % m for i in range(k)]
+        sequence = general_fibonacci_generator(seeds, j, k, m, n=k + 3000)
+        for n_steps in (0, 1, j, k, 1000, 2**11):
+            assert fibonacci_jump(seeds, j, k, m, n_steps) == sequence[n_steps:n_steps + k]
+
+        gen = LaggedFibonacciGenerator(j, k, m, seed_list=seeds)
+        streams = gen.substreams(4, log2_stride=9)
+        blocks = [stream.next_block(512) for stream in streams]
+        assert [int(v) for v in np.concatenate(blocks)] == sequence[k:k + 2048]
+    print("Jump-ahead check passed: substreams match sequential generation.")
+
+class LaggedFibonacciGenerator:
+    """
+    Streaming lagged Fibonacci generator x[i] = (x[i-j] + x[i-k]) % m.
+
+    The state is the last k values. Because x[i] only reaches back j steps,
+    j new values are produced per vectorized numpy step, so large lags such as
+    (24, 55) or (273, 607) are both better generators and faster. Output comes
+    in fixed-size numpy blocks with constant memory.
+
+    Seed with seed_list (k initial values, as in general_fibonacci_generator)
+    or with an integer seed, which fills the state from numpy's SeedSequence.
+    """
+
+    # Standard (j, k) lag pairs with long periods for m = 2**w
+    STANDARD_LAGS = [(5, 17), (24, 55), (38, 89), (273, 607), (576, 1279)]
+
+    def __init__(self, j=24, k=55, m=2**32, seed=None, seed_list=None):
+        if not 0 < j < k:
+            raise ValueError("Lags must satisfy 0 < j < k")
+        if not 1 < m <= 2**64:
+            raise ValueError("Modulus must be in (1, 2**64]")
+        if m & (m - 1) and m > 2**63:
+            raise ValueError("A modulus that is not a power of two must be at most 2**63, "
+                             "so the sum of two residues fits in uint64")
+        self.j, self.k, self.m = j, k, m
+        # For m = 2**w the low w bits of a uint64 sum do not depend on the
+        # high bits, so the state can wrap freely and is masked on output
+        self._mask = np.uint64(m - 1) if m & (m - 1) == 0 else None
+        if seed_list is not None:
+            if len(seed_list) != k:
+                raise ValueError(f"seed_list must hold k={k} values")
+            state = np.array([v % m for v in seed_list], dtype=np.uint64)
+        else:
+            rng = np.random.default_rng(seed)
+            state = rng.integers(0, m, size=k, dtype=np.uint64)
+            if not (state & 1).any():
+                state[0] |= np.uint64(1)  # For m = 2**w at least one seed must be odd
+        self._state = state
+
+    def next_block(self, size):
+        """Return the next `size` integers of the stream in [0, m)."""
+        j, k = self.j, self.k
+        buf = np.empty(k + size, dtype=np.uint64)
+        buf[:k] = self._state
+        for pos in range(k, k + size, j):
+            end = min(pos + j, k + size)
+            np.add(buf[pos - j:end - j], buf[pos - k:end - k], out=buf[pos:end])
+            if self._mask is None:
+                np.remainder(buf[pos:end], np.uint64(self.m), out=buf[pos:end])
+        self._state = buf[size:].copy()
+        out = buf[k:]
+        if self._mask is not None:
+            np.bitwise_and(out, self._mask, out=out)
+        return out
+
+    def random(self, size):
+        """Return the next `size` floats in [0, 1)."""
+        values = self.next_block(size)
+        if self.m == 2**64:
+            return (values >> np.uint64(11)) * 2.0**-53
+        return values / self.m
+
+    def state(self):
+        """Current state (the last k values, oldest first) reduced mod m."""
+        return self._state & self._mask if self._mask is not None else self._state.copy()
+
+    def jump(self, n_steps):
+        """Advance the stream by n_steps values in O(k^3 log n_steps) time."""
+        M = fibonacci_jump_matrix(self.j, self.k, self.m, n_steps)
+        self._state = _matmul_mod(M, self.state()[:, None], self.m)[:, 0]
+        return self
+
+    def copy(self):
+        """Independent generator with the same parameters and state."""
+        other = LaggedFibonacciGenerator.__new__(LaggedFibonacciGenerator)
+        other.__dict__.update(self.__dict__)
+        other._state = self._state.copy()
+        return other
+
+    def substreams(self, n_streams, log2_stride=64):
+        """
+        Split the stream into n_streams generators starting 2**log2_stride
+        values apart, e.g. one per parallel worker. Stream i produces exactly
+        the values this generator would produce after i * 2**log2_stride draws.
+        """
+        streams = [self.copy()]
+        for _ in range(1, n_streams):
+            streams.append(streams[-1].copy().jump(2**log2_stride))
+        return streams
+
+    def chunks(self, chunk_size, n_chunks=None, floats=True):
+        """Yield fixed-size chunks on demand (forever if n_chunks is None)."""
+        produced = 0
+        while n_chunks is None or produced < n_chunks:
+            yield self.random(chunk_size) if floats else self.next_block(chunk_size)
+            produced += 1
+
 def builtin_random_generator(seed, n=10):
     """
     Your original Built-in Random.
@@ -120,8 +442,372 @@ def analyze_quality(results):
         
         print(f"{name}: mean={mean:.2f}, std={std:.2f}, unique={unique}/{len(numbers)}")
 
+# --- Streaming Statistical Tests ---
+
+class StreamingTestBattery:
+    """
+    Statistical tests for a stream of floats in [0, 1), fed chunk by chunk.
+
+    Every test keeps only fixed-size accumulators (plus a carry of fewer than
+    one block of samples between chunks), so 10**9 samples can be tested in
+    constant memory. Call update(chunk) for each chunk, then results().
+    """
+
+    def __init__(self, bins=256, pair_bins=16, triple_bins=8, gap_range=(0.0, 0.25),
+                 gap_classes=16, birthdays=512, birthday_days=2**24, fft_length=1024):
+        self.bins, self.pair_bins, self.triple_bins = bins, pair_bins, triple_bins
+        self.gap_range, self.gap_classes = gap_range, gap_classes
+        self.birthdays, self.birthday_days = birthdays, birthday_days
+        self.fft_length = fft_length
+
+        self.n = 0
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.pair_counts = np.zeros(pair_bins**2, dtype=np.int64)
+        self.triple_counts = np.zeros(triple_bins**3, dtype=np.int64)
+        self.sum_u = self.sum_u2 = self.sum_lag1 = 0.0
+        self.last_u = None
+        self.n_above = self.n_runs = 0
+        self.last_above = None
+        self.gap_counts = np.zeros(gap_classes, dtype=np.int64)
+        self.last_hit = None
+        self.birthday_sets = self.birthday_duplicates = 0
+        self.fft_blocks = self.fft_below = 0
+        self._carry = {}
+
+    def _blocks(self, name, chunk, size):
+        """Prepend the carry for `name`, return full rows of `size`, keep the rest."""
+        data = np.concatenate((self._carry.get(name, chunk[:0]), chunk))
+        n_full = data.size // size * size
+        self._carry[name] = data[n_full:].copy()
+        return data[:n_full].reshape(-1, size)
+
+    def update(self, chunk):
+        u = np.asarray(chunk, dtype=np.float64).ravel()
+        if u.size == 0:
+            return
+        offset = self.n
+        self.n += u.size
+
+        # Uniformity (chi-square on equal bins)
+        self.counts += np.bincount(np.minimum((u * self.bins).astype(np.intp), self.bins - 1),
+                                   minlength=self.bins)
+
+        # Serial pairs and triples (non-overlapping tuples)
+        d = self.pair_bins
+        pairs = np.minimum((self._blocks('pair', u, 2) * d).astype(np.intp), d - 1)
+        self.pair_counts += np.bincount(pairs[:, 0] * d + pairs[:, 1], minlength=d**2)
+        d = self.triple_bins
+        triples = np.minimum((self._blocks('triple', u, 3) * d).astype(np.intp), d - 1)
+        self.triple_counts += np.bincount((triples[:, 0] * d + triples[:, 1]) * d + triples[:, 2],
+                                          minlength=d**3)
+
+        # Lag-1 serial correlation
+        self.sum_u += u.sum()
+        self.sum_u2 += np.dot(u, u)
+        self.sum_lag1 += np.dot(u[:-1], u[1:])
+        if self.last_u is not None:
+            self.sum_lag1 += self.last_u * u[0]
+        self.last_u = u[-1]
+
+        # Runs above / below 0.5
+        above = u >= 0.5
+        self.n_above += int(above.sum())
+        self.n_runs += int(np.count_nonzero(above[1:] != above[:-1]))
+        self.n_runs += 1 if self.last_above is None else int(above[0] != self.last_above)
+        self.last_above = above[-1]
+
+        # Gap test: lengths of gaps between visits to gap_range
+        lo, hi = self.gap_range
+        hits = np.flatnonzero((u >= lo) & (u < hi)) + offset
+        if hits.size:
+            previous = hits[:1] - 1 if self.last_hit is None else np.array([self.last_hit])
+            gaps = np.diff(np.concatenate((previous, hits))) - 1
+            if self.last_hit is None:
+                gaps = gaps[1:]
+            self.gap_counts += np.bincount(np.minimum(gaps, self.gap_classes - 1),
+                                           minlength=self.gap_classes)
+            self.last_hit = hits[-1]
+
+        # Birthday spacings
+        days = np.sort((self._blocks('birthday', u, self.birthdays) * self.birthday_days)
+                       .astype(np.int64), axis=1)
+        if days.size:
+            spacings = np.sort(np.diff(days, axis=1, prepend=0), axis=1)
+            self.birthday_duplicates += int(np.count_nonzero(spacings[:, 1:] == spacings[:, :-1]))
+            self.birthday_sets += days.shape[0]
+
+        # Spectral (discrete Fourier transform) test on the bits u < 0.5
+        bits = self._blocks('fft', u, self.fft_length)
+        if bits.size:
+            L = self.fft_length
+            spectrum = np.abs(np.fft.rfft(np.where(bits < 0.5, 1.0, -1.0), axis=1))[:, :L // 2]
+            threshold = np.sqrt(np.log(1 / 0.05) * L)
+            self.fft_below += int(np.count_nonzero(spectrum < threshold))
+            self.fft_blocks += bits.shape[0]
+
+    def results(self):
+        """Return {test name: (statistic, p-value)}; NaN where there is too little data."""
+        nan = (np.nan, np.nan)
+        res = {}
+
+        def chi_square(counts, probabilities):
+            expected = counts.sum() * probabilities
+            if expected.min() < 5:
+                return nan
+            chi2 = np.sum((counts - expected)**2 / expected)
+            return chi2, stats.chi2.sf(chi2, counts.size - 1)
+
+        res['Uniformity (chi-square)'] = chi_square(self.counts, np.full(self.bins, 1 / self.bins))
+        res['Serial pairs'] = chi_square(self.pair_counts, np.full(self.pair_bins**2,
+                                                                   1 / self.pair_bins**2))
+        res['Serial triples'] = chi_square(self.triple_counts, np.full(self.triple_bins**3,
+                                                                       1 / self.triple_bins**3))
+
+        n = self.n
+        if n > 2:
+            mean = self.sum_u / n
+            var = self.sum_u2 / n - mean**2
+            if var > 0:
+                r = (self.sum_lag1 / (n - 1) - mean**2) / var
+                z = r * np.sqrt(n)
+                res['Serial correlation (lag 1)'] = (r, 2 * stats.norm.sf(abs(z)))
+            else:
+                res['Serial correlation (lag 1)'] = (np.nan, 0.0)
+        else:
+            res['Serial correlation (lag 1)'] = nan
+
+        n1, n2 = self.n_above, n - self.n_above
+        if n1 and n2:
+            mu = 2 * n1 * n2 / n + 1
+            sigma = np.sqrt((mu - 1) * (mu - 2) / (n - 1))
+            z = (self.n_runs - mu) / sigma
+            res['Runs (above/below 0.5)'] = (z, 2 * stats.norm.sf(abs(z)))
+        else:
+            res['Runs (above/below 0.5)'] = (np.nan, 0.0) if n else nan
+
+        p_hit = self.gap_range[1] - self.gap_range[0]
+        r = np.arange(self.gap_classes)
+        gap_p = p_hit * (1 - p_hit)**r
+        gap_p[-1] = (1 - p_hit)**(self.gap_classes - 1)
+        res['Gap'] = chi_square(self.gap_counts, gap_p) if self.gap_counts.sum() else nan
+
+        if self.birthday_sets:
+            lam = self.birthday_sets * self.birthdays**3 / (4 * self.birthday_days)
+            k = self.birthday_duplicates
+            p = min(1.0, 2 * min(stats.poisson.cdf(k, lam), stats.poisson.sf(k - 1, lam)))
+            res['Birthday spacings'] = (k, p)
+        else:
+            res['Birthday spacings'] = nan
+
+        if self.fft_blocks:
+            L = self.fft_length
+            expected = self.fft_blocks * 0.95 * L / 2
+            d = (self.fft_below - expected) / np.sqrt(self.fft_blocks * L * 0.95 * 0.05 / 4)
+            res['Spectral (FFT)'] = (d, 2 * stats.norm.sf(abs(d)))
+        else:
+            res['Spectral (FFT)'] = nan
+        return res
+
+def run_test_battery(chunks, **kwargs):
+    """Feed an iterable of float chunks through a StreamingTestBattery."""
+    battery = StreamingTestBattery(**kwargs)
+    for chunk in chunks:
+        battery.update(chunk)
+    return battery.results()
+
+def mid_square_chunks(seed, n_digits=4, chunk_size=2**16):
+    """Endless Mid-Square stream as floats, continuing through collapse or cycles."""
+    scale = 10**(2 * (n_digits // 2))
+    x = seed
+    while True:
+        values, _ = mid_square_vectorized([x], n_digits=n_digits, n=chunk_size)
+        x = values[-1, 0]
+        yield values[:, 0] / scale
+
+def builtin_random_chunks(seed, chunk_size=2**16):
+    """Endless stream from Python's built-in Mersenne Twister as 53-bit floats."""
+    r = random.Random(seed)
+    while True:
+        raw = np.frombuffer(r.randbytes(8 * chunk_size), dtype=np.uint64)
+        yield (raw >> np.uint64(11)) * 2.0**-53
+
+def generator_streams(chunk_size=2**16):
+    """
+    The generators of run_comparison as chunk streams. The Fibonacci variants
+    use m = 2**32 instead of 100 so the tests see the recurrence rather than
+    just 100 output levels.
+    """
+    return {
+        'Mid-Square': mid_square_chunks(5731, n_digits=4, chunk_size=chunk_size),
+        'Lagged Fibonacci': LaggedFibonacciGenerator(1, 2, m=2**32, seed_list=[1, 2])
+            .chunks(chunk_size),
+        'General Fibonacci': LaggedFibonacciGenerator(3, 5, m=2**32, seed_list=[1, 2, 3, 4, 5])
+            .chunks(chunk_size),
+        'Lagged Fib (24,55)': LaggedFibonacciGenerator(24, 55, m=2**32, seed=42).chunks(chunk_size),
+        'Built-in Random': builtin_random_chunks(42, chunk_size=chunk_size),
+    }
+
+def battery_report(n_samples=10**6, chunk_size=2**16):
+    """Run the streaming battery on every generator and print a p-value table."""
+    n_chunks = -(-n_samples // chunk_size)
+    table = {}
+    for name, stream in generator_streams(chunk_size).items():
+        table[name] = run_test_battery(itertools.islice(stream, n_chunks))
+
+    tests = list(next(iter(table.values())))
+    print("\n" + "="*50)
+    print(f"STATISTICAL TEST BATTERY ({n_chunks * chunk_size:,} samples, p-values)")
+    print("="*50)
+    print(f"{'Test':<28}" + "".join(f"{name:>20}" for name in table))
+    for test in tests:
+        print(f"{test:<28}" + "".join(f"{table[name][test][1]:>20.3g}" for name in table))
+    return table
+
+# --- numpy.random Adapter ---
+
+class _bitgen_t(ctypes.Structure):
+    """Layout of numpy's bitgen_t struct (numpy/random/bitgen.h)."""
+    _fields_ = [('state', ctypes.c_void_p),
+                ('next_uint64', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+                ('next_uint32', ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)),
+                ('next_double', ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)),
+                ('next_raw', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p))]
+
+class HomegrownBitGenerator:
+    """
+    Wraps a bulk source of 64-bit words (a callable n -> uint64 array) for use
+    with numpy.random.
+
+    random/uniform/standard_exponential/exponential/standard_normal/normal are
+    computed in vectorized batches straight from the bulk words. The object
+    also exposes the `capsule` and `lock` numpy expects from a bit generator,
+    so numpy.random.Generator(adapter) gives every other distribution too.
+    That path calls back into Python once per word, served from a buffer
+    refilled in blocks.
+    """
+
+    def __init__(self, fill, block_size=2**16, name='homegrown'):
+        self.fill = fill
+        self.block_size = block_size
+        self.name = name
+        self.lock = threading.Lock()
+        self._buffer = []
+        self._pos = 0
+        next_uint64 = lambda _: self._next_word()
+
+        fields = dict(_bitgen_t._fields_)
+        # Keep the callbacks referenced for as long as the struct is alive
+        self._callbacks = (fields['next_uint64'](next_uint64),
+                           fields['next_uint32'](lambda state: next_uint64(state) >> 32),
+                           fields['next_double'](lambda state: (next_uint64(state) >> 11) * 2.0**-53),
+                           fields['next_raw'](next_uint64))
+        self._bitgen = _bitgen_t(None, *self._callbacks)
+        capsule_new = ctypes.pythonapi.PyCapsule_New
+        capsule_new.restype = ctypes.py_object
+        capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+        self.capsule = capsule_new(ctypes.addressof(self._bitgen), b"BitGenerator", None)
+
+    def _next_word(self):
+        """One word from the buffer, refilled in blocks of block_size."""
+        if self._pos == len(self._buffer):
+            self._buffer = self.fill(self.block_size).tolist()
+            self._pos = 0
+        self._pos += 1
+        return self._buffer[self._pos - 1]
+
+    @classmethod
+    def from_lagged_fibonacci(cls, j=24, k=55, seed=None, **kwargs):
+        """Adapter over a LaggedFibonacciGenerator with m = 2**64."""
+        gen = LaggedFibonacciGenerator(j, k, m=2**64, seed=seed)
+        return cls(gen.next_block, name=f'Lagged Fibonacci ({j},{k})', **kwargs)
+
+    @classmethod
+    def from_mid_square(cls, n_digits=8, n_lanes=4096, seed=None, **kwargs):
+        """
+        Adapter over n_lanes Mid-Square sequences advanced in lockstep.
+        Each value carries only n_digits decimal digits, placed in the top
+        bits of the word; collapsed lanes simply keep producing zeros.
+        """
+        lanes = np.random.default_rng(seed).integers(1, 10**n_digits, n_lanes)
+        scale = 2.0**53 / 10**(2 * (n_digits // 2))
+
+        def fill(n):
+            nonlocal lanes
+            values, _ = mid_square_vectorized(lanes, n_digits=n_digits, n=-(-n // n_lanes))
+            lanes = values[-1].copy()
+            words = (values.ravel()[:n] * scale).astype(np.uint64) << np.uint64(11)
+            return words
+
+        return cls(fill, name=f'Mid-Square ({n_digits} digits)', **kwargs)
+
+    def as_generator(self):
+        """numpy.random.Generator drawing its bits from this source."""
+        return np.random.Generator(self)
+
+    def random_raw(self, size=None):
+        # Scalar draws come from the block buffer, not a fresh fill(1) each
+        if size is None:
+            return np.uint64(self._next_word())
+        return self.fill(int(np.prod(size))).reshape(size)
+
+    def random(self, size=None):
+        return (self.random_raw(size) >> np.uint64(11)) * 2.0**-53
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + (high - low) * self.random(size)
+
+    def standard_exponential(self, size=None):
+        return -np.log1p(-self.random(size))
+
+    def exponential(self, scale=1.0, size=None):
+        return scale * self.standard_exponential(size)
+
+    def standard_normal(self, size=None):
+        # Box-Muller on pairs of uniforms
+        n = 1 if size is None else int(np.prod(size))
+        u = self.random(2 * (-(-n // 2))).reshape(2, -1)
+        radius = np.sqrt(-2 * np.log1p(-u[0]))
+        z = np.concatenate((radius * np.cos(2 * np.pi * u[1]), radius * np.sin(2 * np.pi * u[1])))[:n]
+        return z[0] if size is None else z.reshape(size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return loc + scale * self.standard_normal(size)
+
+def compare_generators_monte_carlo(n_samples=10**6, seed=42):
+    """
+    Run the same small Monte Carlo experiments (π from the quarter circle, mean
+    of exponential and spread of normal draws) under numpy's default generator
+    and each homegrown adapter. Also report bulk throughput and how many
+    streaming battery tests fail at p < 0.001.
+    """
+    sources = {
+        'numpy PCG64': np.random.default_rng(seed),
+        'Lagged Fib (24,55)': HomegrownBitGenerator.from_lagged_fibonacci(24, 55, seed=seed),
+        'Lagged Fib (273,607)': HomegrownBitGenerator.from_lagged_fibonacci(273, 607, seed=seed),
+        'Mid-Square (8 digits)': HomegrownBitGenerator.from_mid_square(8, seed=seed),
+    }
+    print("\n" + "="*50)
+    print(f"MONTE CARLO UNDER EACH GENERATOR ({n_samples:,} samples)")
+    print("="*50)
+    print(f"{'Generator':<24}{'M uniforms/s':>14}{'|π̂ - π|':>11}{'|mean(exp) - 1|':>17}"
+          f"{'|std(normal) - 1|':>19}{'Failed tests':>14}")
+    for name, rng in sources.items():
+        start = time.perf_counter()
+        u = rng.random(n_samples)
+        rate = n_samples / (time.perf_counter() - start) / 1e6
+        x, y = u[::2], u[1::2]
+        pi_error = abs(4 * np.mean(x * x + y * y <= 1) - np.pi)
+        exp_error = abs(rng.standard_exponential(n_samples).mean() - 1)
+        normal_error = abs(rng.standard_normal(n_samples).std() - 1)
+        chunks = (rng.random(2**16) for _ in range(-(-n_samples // 2**16)))
+        failed = sum(p < 1e-3 for _, p in run_test_battery(chunks).values())
+        print(f"{name:<24}{rate:>14.1f}{pi_error:>11.2e}{exp_error:>17.2e}"
+              f"{normal_error:>19.2e}{failed:>14}")
+
 # --- Main execution ---
 if __name__ == "__main__":
+    # Use a style for better-looking plots (set here so importing PRNG leaves other plots alone)
+    plt.style.use('seaborn-v0_8-darkgrid')
     
     results = run_comparison()
     
@@ -129,4 +815,19 @@ if __name__ == "__main__":
     visualize_randomness(results)
     
     # Run the statistical analysis
-    analyze_quality(results)
\ No newline at end of file
+    analyze_quality(results)
+
+    # Survey the whole 4-digit seed space at once
+    survey_mid_square_seeds(n_digits=4, n=100)
+
+    # Jump-ahead must agree with stepping the generators one value at a time
+    verify_jump_ahead()
+
+    # Transient and period of every seed, for 2 to 6 digits
+    period_sweep(max_digits=6)
+
+    # Streaming statistical tests on a million samples per generator
+    battery_report(n_samples=10**6)
+
+    # Monte Carlo experiments rerun under each generator
+    compare_generators_monte_carlo()
\ No newline at end of file
@@ -5,17 +5,22 @@ from matplotlib.animation import FuncAnimation
 import matplotlib.patches as patches
 import itertools
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import qmc
 
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
-clear_screen()
 
-def simple_pi_calculation(num_points):
+def simple_pi_calculation(num_points, rng=None):
     """
-    Simple version without animation for quick calculation
+    Simple version without animation for quick calculation.
+    rng may be a numpy Generator or a PRNG.HomegrownBitGenerator adapter;
+    by default the global np.random is used.
     """
-    x = np.random.uniform(-1, 1, num_points)
-    y = np.random.uniform(-1, 1, num_points)
+    rng = np.random if rng is None else rng
+    x = rng.uniform(-1, 1, num_points)
+    y = rng.uniform(-1, 1, num_points)
     inside_circle = (x**2 + y**2) <= 1
     pi_estimate = 4 * np.sum(inside_circle) / num_points
     
@@ -27,9 +32,208 @@ def simple_pi_calculation(num_points):
     
     return pi_estimate
 
-def animate_pi_calculation(max_points, points_per_frame):
+def _count_hits_in_chunk(args):
+    """
+    Worker: count points of one chunk that fall inside the quarter circle.
+    Points are drawn in fixed-size buffers filled in place, so memory stays
+    bounded by buffer_size whatever the chunk size.
+    """
+    seed_seq, n_points, buffer_size, dtype = args
+    rng = np.random.default_rng(seed_seq)
+    x = np.empty(buffer_size, dtype=dtype)
+    y = np.empty(buffer_size, dtype=dtype)
+    hits = 0
+    remaining = n_points
+    while remaining > 0:
+        n = min(buffer_size, remaining)
+        xb, yb = x[:n], y[:n]
+        rng.random(out=xb, dtype=dtype)
+        rng.random(out=yb, dtype=dtype)
+        np.multiply(xb, xb, out=xb)
+        np.multiply(yb, yb, out=yb)
+        np.add(xb, yb, out=xb)
+        hits += int(np.count_nonzero(xb <= 1))
+        remaining -= n
+    return hits
+
+def parallel_pi_calculation(num_points, seed=None, n_workers=None, chunk_size=10**7,
+                            buffer_size=2**20, dtype=np.float64):
+    """
+    Large-scale version for N up to ~1e11 points.
+
+    N is split into fixed-size chunks, each with its own independent stream
+    spawned from SeedSequence(seed). Chunks run on a process pool and only the
+    integer hit counts are reduced, so the result is bit-reproducible for a
+    given seed and worker count. The split into chunks does not depend on
+    n_workers, so changing the worker count gives the same result as well.
+    """
+    if num_points < 1 or chunk_size < 1:
+        raise ValueError("num_points and chunk_size must be positive")
+    n_chunks = -(-num_points // chunk_size)
+    sizes = [chunk_size] * (n_chunks - 1) + [num_points - chunk_size * (n_chunks - 1)]
+    streams = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(ss, n, min(buffer_size, n), dtype) for ss, n in zip(streams, sizes)]
+
+    start = time.perf_counter()
+    if n_workers == 1:
+        hits = sum(map(_count_hits_in_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            hits = sum(pool.map(_count_hits_in_chunk, tasks, chunksize=max(1, n_chunks // 64)))
+    elapsed = time.perf_counter() - start
+
+    pi_estimate = 4 * hits / num_points
+    p = hits / num_points
+    std_error = 4 * np.sqrt(p * (1 - p) / num_points)
+
+    print(f"Total points: {num_points:,} in {n_chunks:,} chunks")
+    print(f"Points inside circle: {hits:,}")
+    print(f"Estimated π: {pi_estimate:.10f} ± {std_error:.2e}")
+    print(f"Actual π: {np.pi:.10f}")
+    print(f"Error: {abs(pi_estimate - np.pi) / np.pi * 100:.6f}%")
+    print(f"Throughput: {num_points / elapsed:,.0f} samples/s ({elapsed:.2f} s)")
+
+    return pi_estimate
+
+PI_ESTIMATORS = ('uniform', 'antithetic', 'stratified', 'sobol', 'halton')
+
+def _inside(x, y):
+    """4 times the quarter-circle indicator, so its mean estimates π."""
+    return 4.0 * (x * x + y * y <= 1)
+
+def _qmc_engine(method, rng):
+    """A freshly scrambled 2D low-discrepancy sequence."""
+    if method == 'sobol':
+        return qmc.Sobol(d=2, scramble=True, seed=rng)
+    return qmc.Halton(d=2, scramble=True, seed=rng)
+
+def _pi_batch(method, n, rng, n_replicates=16):
+    """
+    One batch of about n samples with the chosen estimator.
+    Returns (estimate, variance of the estimate, samples used).
+    """
+    if method == 'uniform':
+        f = _inside(rng.random(n), rng.random(n))
+        return f.mean(), f.var(ddof=1) / n, n
+    if method == 'antithetic':
+        # Pair every point u with its reflection 1-u
+        n_pairs = max(n // 2, 2)
+        x, y = rng.random(n_pairs), rng.random(n_pairs)
+        g = 0.5 * (_inside(x, y) + _inside(1 - x, 1 - y))
+        return g.mean(), g.var(ddof=1) / n_pairs, 2 * n_pairs
+    if method == 'stratified':
+        # m x m equal cells, two uniform points per cell
+        m = max(int(np.sqrt(n / 2)), 1)
+        i, j = np.divmod(np.arange(m * m), m)
+        f1 = _inside((i + rng.random(m * m)) / m, (j + rng.random(m * m)) / m)
+        f2 = _inside((i + rng.random(m * m)) / m, (j + rng.random(m * m)) / m)
+        return 0.5 * (f1.mean() + f2.mean()), np.mean((f1 - f2)**2) / (4 * m * m), 2 * m * m
+    if method in ('sobol', 'halton'):
+        # Randomised QMC: independent scrambles give an unbiased error estimate
+        m = max(int(np.log2(max(n // n_replicates, 2))), 1)
+        estimates = np.empty(n_replicates)
+        for r in range(n_replicates):
+            points = _qmc_engine(method, rng).random(2**m)
+            estimates[r] = _inside(points[:, 0], points[:, 1]).mean()
+        return estimates.mean(), estimates.var(ddof=1) / n_replicates, n_replicates * 2**m
+    raise ValueError(f"Unknown estimator '{method}', expected one of {PI_ESTIMATORS}")
+
+def estimate_pi(num_points, method='uniform', seed=None):
+    """
+    Estimate π with a selectable estimator.
+    Returns (pi_estimate, standard_error, samples_used).
+    """
+    rng = np.random.default_rng(seed)
+    estimate, variance, used = _pi_batch(method, num_points, rng)
+    return estimate, np.sqrt(variance), used
+
+def run_until_pi(target_error, method='uniform', seed=None, initial_batch=2**12,
+                 max_batch=2**22, max_points=10**9):
+    """
+    Keep drawing batches (doubling in size up to max_batch) until the estimated
+    standard error drops below target_error or max_points is exhausted.
+    Returns (pi_estimate, standard_error, samples_used); samples_used never
+    exceeds max_points. If max_points is too small for a single batch the
+    result is (nan, inf, 0).
+
+    For 'sobol' and 'halton' the same scrambled sequences are extended each
+    round (the total per replicate doubles), so the low-discrepancy
+    convergence rate is kept while each draw stays below max_batch points.
+    """
+    rng = np.random.default_rng(seed)
+    estimate, std_error = np.nan, np.inf
+    if method in ('sobol', 'halton'):
+        n_replicates = 16
+        engines = [_qmc_engine(method, rng) for _ in range(n_replicates)]
+        hit_sums = np.zeros(n_replicates)
+        per_replicate = 0
+        budget = max_points // n_replicates
+        draw = 2**max(int(np.log2(max(initial_batch // n_replicates, 2))), 1)
+        while per_replicate < budget:
+            # The last round only takes what is left of the budget
+            draw = min(draw, budget - per_replicate)
+            for r, engine in enumerate(engines):
+                remaining = draw
+                while remaining > 0:
+                    block = min(remaining, max_batch)
+                    points = engine.random(block)
+                    hit_sums[r] += _inside(points[:, 0], points[:, 1]).sum()
+                    remaining -= block
+            per_replicate += draw
+            estimates = hit_sums / per_replicate
+            estimate = estimates.mean()
+            std_error = estimates.std(ddof=1) / np.sqrt(n_replicates)
+            if std_error < target_error:
+                break
+            draw = per_replicate
+        return estimate, std_error, per_replicate * n_replicates
+
+    weighted_sum = 0.0
+    weighted_var = 0.0
+    total = 0
+    batch = initial_batch
+    while total < max_points:
+        # Clamp to the remaining budget; below 4 points no estimator fits in it
+        batch = min(batch, max_points - total)
+        if batch < 4:
+            break
+        batch_estimate, variance, used = _pi_batch(method, batch, rng)
+        weighted_sum += used * batch_estimate
+        weighted_var += used**2 * variance
+        total += used
+        estimate = weighted_sum / total
+        std_error = np.sqrt(weighted_var) / total
+        if std_error < target_error:
+            break
+        batch = min(2 * batch, max_batch)
+    return estimate, std_error, total
+
+def benchmark_pi_estimators(targets=(1e-3, 1e-4, 1e-5), methods=PI_ESTIMATORS, seed=0,
+                            max_points=10**8):
+    """
+    Compare samples and wall time needed by each estimator to reach each
+    target standard error.
+    """
+    print(f"{'Estimator':<12}{'Target':>10}{'Samples':>15}{'Time (s)':>11}{'Std error':>12}{'|π̂ - π|':>12}")
+    results = []
+    for method in methods:
+        for target in targets:
+            start = time.perf_counter()
+            estimate, std_error, used = run_until_pi(target, method, seed=seed, max_points=max_points)
+            elapsed = time.perf_counter() - start
+            reached = '' if std_error < target else '  (not reached)'
+            print(f"{method:<12}{target:>10.0e}{used:>15,}{elapsed:>11.3f}{std_error:>12.2e}"
+                  f"{abs(estimate - np.pi):>12.2e}{reached}")
+            results.append((method, target, used, elapsed, std_error, estimate))
+    return results
+
+def animate_pi_calculation(max_points, points_per_frame, mode='scatter', resolution=256):
     """
     Animate the Monte Carlo π calculation process with live data generation.
+
+    mode='scatter' draws every point individually. mode='density' bins the points
+    into a fixed resolution x resolution hit-count raster drawn with imshow, so the
+    per-frame cost and memory stay constant however many points have been drawn.
     """
     # --- Set up the figure and axes ---
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -48,9 +252,22 @@ def animate_pi_calculation(max_points, points_per_frame):
     ax1.add_patch(circle)
     ax1.add_patch(square)
 
-    inside_scatter = ax1.scatter([], [], s=2, color='#d62728', label='Inside')
-    outside_scatter = ax1.scatter([], [], s=2, color='#1f77b4', label='Outside')
-    ax1.legend(loc='upper right')
+    if mode == 'density':
+        # Hit-count raster over the square; cells whose centre lies inside the
+        # circle are drawn with positive values (red), the rest negative (blue)
+        hit_counts = np.zeros(resolution * resolution, dtype=np.int64)
+        centres = -1 + (np.arange(resolution) + 0.5) * 2 / resolution
+        cell_inside = (centres[None, :]**2 + centres[:, None]**2 <= 1).ravel()
+        cell_sign = np.where(cell_inside, 1.0, -1.0)
+        density_image = ax1.imshow(np.zeros((resolution, resolution)), extent=(-1, 1, -1, 1),
+                                   origin='lower', cmap='RdBu_r', vmin=-1, vmax=1,
+                                   interpolation='nearest')
+    elif mode == 'scatter':
+        inside_scatter = ax1.scatter([], [], s=2, color='#d62728', label='Inside')
+        outside_scatter = ax1.scatter([], [], s=2, color='#1f77b4', label='Outside')
+        ax1.legend(loc='upper right')
+    else:
+        raise ValueError(f"Unknown mode '{mode}', expected 'scatter' or 'density'")
 
     # Plot 2: π estimate convergence
     ax2.set_xlim(0, max_points)
@@ -71,18 +288,21 @@ def animate_pi_calculation(max_points, points_per_frame):
     total_points = 0
     # Use lists to store points for efficient updating
     x_in, y_in, x_out, y_out = [], [], [], []
-    # Store history for the convergence plot
-    pi_history = []
-    count_history = []
+    # Store history for the convergence plot (one entry per frame, preallocated)
+    n_frames = -(-max_points // points_per_frame)
+    pi_history = np.zeros(n_frames)
+    count_history = np.zeros(n_frames, dtype=np.int64)
+    frames_done = 0
+    artists = (density_image,) if mode == 'density' else (inside_scatter, outside_scatter)
     
     def update(frame):
         """Update function: generates new data and updates the plot."""
-        nonlocal points_inside, total_points
+        nonlocal points_inside, total_points, frames_done
 
         # Stop the animation if the max number of points is reached
         if total_points >= max_points:
             anim.event_source.stop()
-            return inside_scatter, outside_scatter, pi_line, pi_text
+            return (*artists, pi_line, pi_text)
 
         # 1. Generate a new batch of random points
         new_x = np.random.uniform(-1, 1, points_per_frame)
@@ -95,20 +315,32 @@ def animate_pi_calculation(max_points, points_per_frame):
         points_inside += np.sum(is_inside)
         total_points += points_per_frame
         
-        x_in.extend(new_x[is_inside])
-        y_in.extend(new_y[is_inside])
-        x_out.extend(new_x[~is_inside])
-        y_out.extend(new_y[~is_inside])
+        if mode == 'density':
+            # Bin only the new batch into the raster: O(points_per_frame + resolution^2)
+            col = np.minimum(((new_x + 1) * (resolution / 2)).astype(np.intp), resolution - 1)
+            row = np.minimum(((new_y + 1) * (resolution / 2)).astype(np.intp), resolution - 1)
+            np.add(hit_counts, np.bincount(row * resolution + col, minlength=resolution * resolution),
+                   out=hit_counts)
+        else:
+            x_in.extend(new_x[is_inside])
+            y_in.extend(new_y[is_inside])
+            x_out.extend(new_x[~is_inside])
+            y_out.extend(new_y[~is_inside])
         
         # 4. Calculate the current estimate of π and store it
         current_pi = 4 * points_inside / total_points
-        pi_history.append(current_pi)
-        count_history.append(total_points)
+        pi_history[frames_done] = current_pi
+        count_history[frames_done] = total_points
+        frames_done += 1
 
         # 5. Update the plots with the new data
-        inside_scatter.set_offsets(np.column_stack([x_in, y_in]))
-        outside_scatter.set_offsets(np.column_stack([x_out, y_out]))
-        pi_line.set_data(count_history, pi_history)
+        if mode == 'density':
+            density = hit_counts * (cell_sign / max(hit_counts.max(), 1))
+            density_image.set_data(density.reshape(resolution, resolution))
+        else:
+            inside_scatter.set_offsets(np.column_stack([x_in, y_in]))
+            outside_scatter.set_offsets(np.column_stack([x_out, y_out]))
+        pi_line.set_data(count_history[:frames_done], pi_history[:frames_done])
         
         # Update text and titles
         error = abs(current_pi - np.pi) / np.pi * 100
@@ -117,7 +349,7 @@ def animate_pi_calculation(max_points, points_per_frame):
                          f'Error: {error:.4f}%')
         ax1.set_title(f'Monte Carlo Simulation - {total_points:,} points')
 
-        return inside_scatter, outside_scatter, pi_line, pi_text
+        return (*artists, pi_line, pi_text)
 
     # Create the animation
     anim = FuncAnimation(fig, update, frames=itertools.count(), 
@@ -127,9 +359,21 @@ def animate_pi_calculation(max_points, points_per_frame):
     plt.show()
 
 if __name__ == "__main__":
+    clear_screen()
     animate_pi_calculation(max_points=200000, points_per_frame=500)
+
+    # Constant cost per frame, suitable for millions of points
+    animate_pi_calculation(max_points=5000000, points_per_frame=20000, mode='density')
     
     # For a more accurate calculation (without animation)
     print("\n" + "="*50)
     print("Running high-precision calculation...")
-    simple_pi_calculation(100000)
\ No newline at end of file
+    simple_pi_calculation(100000)
+
+    print("\n" + "="*50)
+    print("Running large-scale parallel calculation...")
+    parallel_pi_calculation(10**9, seed=12345)
+
+    print("\n" + "="*50)
+    print("Comparing variance-reduced and quasi-Monte Carlo estimators...")
+    benchmark_pi_estimators(targets=(1e-3, 1e-4))
\ No newline at end of file
@@ -8,19 +8,41 @@ def mid_square(seed, n):
     numbers = []
     num = seed
     for _ in range(n):
-        num_str = str(num**2).zfill(8)  # Square and pad with zeros
-        mid = num_str[2:6]  # Extract middle 4 digits
-        num = int(mid)
+        num = (num * num) // 100 % 10000  # Middle 4 digits of the 8-digit square
         numbers.append(num / 10000)  # Normalize to [0, 1)
     return np.array(numbers)
 
+FIXED_POINT = 2**53  # Lagged Fibonacci state is kept as integers / 2**53
+
 def lagged_fibonacci(seed1, seed2, n):
-    """Generate n random numbers using the lagged Fibonacci method."""
-    numbers = [seed1, seed2]
+    """Generate n random numbers using the lagged Fibonacci method.
+    The sum is taken mod 1 in 53-bit fixed point, so it is exact and the
+    stream can be jumped ahead with lagged_fibonacci_jump."""
+    numbers = [round(seed1 * FIXED_POINT), round(seed2 * FIXED_POINT)]
     for _ in range(2, n):
-        next_num = (numbers[-1] + numbers[-2]) % 1
+        next_num = (numbers[-1] + numbers[-2]) % FIXED_POINT
         numbers.append(next_num)
-    return np.array(numbers)
+    return np.array(numbers) / FIXED_POINT
+
+def lagged_fibonacci_jump(seed1, seed2, n_steps):
+    """Seeds (x[n_steps], x[n_steps + 1]) of the lagged Fibonacci stream, found
+    with the 2x2 companion matrix [[0, 1], [1, 1]] raised to n_steps mod 2**53."""
+    a, b, c, d = 1, 0, 0, 1  # Identity
+    p, q, r, s = 0, 1, 1, 1  # Companion matrix
+    while n_steps:
+        if n_steps & 1:
+            a, b, c, d = ((p * a + q * c) % FIXED_POINT, (p * b + q * d) % FIXED_POINT,
+                          (r * a + s * c) % FIXED_POINT, (r * b + s * d) % FIXED_POINT)
+        p, q, r, s = ((p * p + q * r) % FIXED_POINT, (p * q + q * s) % FIXED_POINT,
+                      (r * p + s * r) % FIXED_POINT, (r * q + s * s) % FIXED_POINT)
+        n_steps >>= 1
+    x0, x1 = round(seed1 * FIXED_POINT), round(seed2 * FIXED_POINT)
+    return (a * x0 + b * x1) % FIXED_POINT / FIXED_POINT, (c * x0 + d * x1) % FIXED_POINT / FIXED_POINT
+
+def lagged_fibonacci_substreams(seed1, seed2, n_streams, n_per_stream):
+    """Non-overlapping consecutive pieces of one stream, one row per worker."""
+    return np.array([lagged_fibonacci(*lagged_fibonacci_jump(seed1, seed2, i * n_per_stream),
+                                      n_per_stream) for i in range(n_streams)])
 
 def fibonacci_generator(n):
     """Generate n Fibonacci numbers."""
@@ -28,20 +50,33 @@ def fibonacci_generator(n):
     for i in range(2, n):
         fib.append(fib[i-1] + fib[i-2])
     return np.array(fib)
-def animate_histogram(data, bins=30, interval=100):
-    """Animate histogram of the data."""
+def animate_histogram(data, bins=30, interval=100, duration=10.0):
+    """Animate histogram of the data.
+    The histogram is built incrementally: each frame bins only the newly
+    revealed samples with np.bincount and updates a single step artist.
+    Enough samples are revealed per frame to finish in about `duration`
+    seconds at 1000/interval frames per second, so long streams stay cheap."""
+    data = np.asarray(data)
+    n_frames = max(1, min(len(data), int(duration * 1000 / interval)))
+    samples_per_frame = -(-len(data) // n_frames)
+    bin_index = np.clip((data * bins).astype(np.intp), 0, bins - 1)
+    counts = np.zeros(bins, dtype=np.int64)
+
     fig, ax = plt.subplots()
     ax.set_xlim(0, 1)
-    ax.set_ylim(0, len(data) // bins)
-    bars = ax.bar(np.linspace(0, 1, bins), np.zeros(bins), width=1/bins)
+    ax.set_ylim(0, 1.1 * max(np.bincount(bin_index, minlength=bins).max(), 1))
+    steps = ax.stairs(counts, np.linspace(0, 1, bins + 1), fill=True)
 
     def update(frame):
-        counts, _ = np.histogram(data[:frame], bins=bins, range=(0, 1))
-        for bar, count in zip(bars, counts):
-            bar.set_height(count)
-        return bars
+        if frame == 0:
+            counts[:] = 0  # Restart when the animation repeats
+        start = frame * samples_per_frame
+        new = bin_index[start:start + samples_per_frame]
+        counts[:] += np.bincount(new, minlength=bins)
+        steps.set_data(values=counts)
+        return steps,
 
-    ani = FuncAnimation(fig, update, frames=len(data), interval=interval, blit=True)
+    ani = FuncAnimation(fig, update, frames=n_frames, interval=interval, blit=True)
     plt.show()
 if __name__ == "__main__":
     n = 1000  # Number of random numbers to generate
@@ -2,12 +2,278 @@ import numpy as np
 import matplotlib.pyplot as plt
 import math
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
-clear_screen()
 
-def simulate_and_analyze_walk(n_steps, step_length, n_simulations):
+def _walk_block(rng, n_walkers, n_steps, step_length, return_paths):
+    """
+    One block of walks: an angle array of shape (n_walkers, n_steps), turned
+    into steps with vectorized trig. Returns final (x, y), or full paths of
+    shape (n_walkers, n_steps + 1) starting at the origin.
+    """
+    angles = rng.random((n_walkers, n_steps))
+    angles *= 2 * np.pi
+    dx = np.cos(angles)
+    dy = np.sin(angles, out=angles)
+    if not return_paths:
+        return step_length * dx.sum(axis=1), step_length * dy.sum(axis=1)
+    x = np.zeros((n_walkers, n_steps + 1))
+    y = np.zeros((n_walkers, n_steps + 1))
+    np.cumsum(dx, axis=1, out=x[:, 1:])
+    np.cumsum(dy, axis=1, out=y[:, 1:])
+    return step_length * x, step_length * y
+
+def _walk_chunk(args):
+    """Worker: one block of walks from its own seed stream."""
+    seed_seq, n_walkers, n_steps, step_length, return_paths = args
+    return _walk_block(np.random.default_rng(seed_seq), n_walkers, n_steps, step_length, return_paths)
+
+def walkers_per_chunk(n_steps, memory_budget, return_paths=False):
+    """How many walkers fit in one block under memory_budget bytes."""
+    bytes_per_walker = 8 * n_steps * (5 if return_paths else 2)
+    return max(1, memory_budget // bytes_per_walker)
+
+def simulate_walk_ensemble(n_walkers, n_steps, step_length=1.0, seed=None, rng=None,
+                           n_workers=1, memory_budget=2**27, return_paths=False):
+    """
+    Simulates an ensemble of 2D random walks in vectorized blocks.
+
+    Walkers are processed in chunks sized so that one chunk's arrays stay
+    within memory_budget bytes. Each chunk draws from its own stream spawned
+    from SeedSequence(seed), and the chunks are spread over n_workers
+    processes, so results depend only on seed, not on the number of workers.
+    If rng is given (a numpy Generator, np.random or a
+    PRNG.HomegrownBitGenerator) the chunks run in this process, drawing from it in order.
+
+    Returns the final positions (x, y), each of shape (n_walkers,), or with
+    return_paths=True the full paths, each of shape (n_walkers, n_steps + 1).
+    """
+    chunk = walkers_per_chunk(n_steps, memory_budget, return_paths)
+    sizes = [min(chunk, n_walkers - start) for start in range(0, n_walkers, chunk)]
+
+    if rng is not None:
+        blocks = [_walk_block(rng, size, n_steps, step_length, return_paths) for size in sizes]
+    else:
+        streams = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = [(ss, size, n_steps, step_length, return_paths) for ss, size in zip(streams, sizes)]
+        if n_workers == 1:
+            blocks = list(map(_walk_chunk, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                blocks = list(pool.map(_walk_chunk, tasks))
+
+    x = np.concatenate([block[0] for block in blocks])
+    y = np.concatenate([block[1] for block in blocks])
+    return x, y
+
+def _msd_chunk(args):
+    """
+    Worker: moment and distribution accumulators over every step index for
+    one block of walks. All outputs are O(n_steps) in size.
+    """
+    seed_seq, n_walkers, n_steps, step_length, n_bins, rho_max = args
+    x, y = _walk_block(np.random.default_rng(seed_seq), n_walkers, n_steps, step_length, True)
+    r2 = x * x + y * y
+    sum_r2 = r2.sum(axis=0)
+    sum_r4 = np.einsum('ij,ij->j', r2, r2)
+
+    # Distribution of the scaled radius r / (l sqrt(n)), so one set of bins fits every n
+    steps = np.arange(1, n_steps + 1)
+    rho = np.sqrt(r2[:, 1:]) / (step_length * np.sqrt(steps))
+    bins = np.minimum((rho * (n_bins / rho_max)).astype(np.intp), n_bins - 1)
+    flat = (np.arange(n_steps) * n_bins + bins).ravel()
+    hist = np.bincount(flat, minlength=n_steps * n_bins).reshape(n_steps, n_bins)
+    return sum_r2, sum_r4, hist
+
+def msd_curves(n_walkers, n_steps, step_length=1.0, seed=None, n_workers=1,
+               memory_budget=2**27, n_bins=40, rho_max=4.0):
+    """
+    Mean-square displacement curves from one ensemble pass.
+
+    Accumulates <r^2>(n), <r^4>(n) and the distribution of r / (l sqrt(n)) for
+    every step index n across all walkers. The accumulators are summed chunk by
+    chunk, so memory is O(n_steps * n_bins) however many walkers are used.
+
+    Returns a dict with arrays indexed by step n = 0..n_steps ('n', 'msd',
+    'r4', 'non_gaussian') and 'hist' (n_steps x n_bins counts for n >= 1)
+    with its 'bin_edges'.
+    """
+    chunk = walkers_per_chunk(n_steps, memory_budget // 2, return_paths=True)
+    sizes = [min(chunk, n_walkers - start) for start in range(0, n_walkers, chunk)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(ss, size, n_steps, step_length, n_bins, rho_max) for ss, size in zip(streams, sizes)]
+
+    sum_r2 = np.zeros(n_steps + 1)
+    sum_r4 = np.zeros(n_steps + 1)
+    hist = np.zeros((n_steps, n_bins), dtype=np.int64)
+
+    def accumulate(results):
+        for chunk_r2, chunk_r4, chunk_hist in results:
+            np.add(sum_r2, chunk_r2, out=sum_r2)
+            np.add(sum_r4, chunk_r4, out=sum_r4)
+            np.add(hist, chunk_hist, out=hist)
+
+    if n_workers == 1:
+        accumulate(map(_msd_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            accumulate(pool.map(_msd_chunk, tasks))
+
+    msd = sum_r2 / n_walkers
+    r4 = sum_r4 / n_walkers
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # 2D non-Gaussian parameter, zero for a Gaussian displacement distribution
+        non_gaussian = r4 / (2 * msd**2) - 1
+    return {'n': np.arange(n_steps + 1), 'msd': msd, 'r4': r4, 'non_gaussian': non_gaussian,
+            'hist': hist, 'bin_edges': np.linspace(0, rho_max, n_bins + 1)}
+
+def fit_diffusion(n, msd, dim=2, n_min=1):
+    """
+    Fits the MSD curve.
+    Normal diffusion <r^2> = 2 dim D n gives D (per step) by least squares
+    through the origin. A log-log fit <r^2> = K n^alpha gives the anomalous
+    exponent alpha (1 for normal diffusion) with its standard error.
+    """
+    n = np.asarray(n, dtype=float)[n_min:]
+    msd = np.asarray(msd, dtype=float)[n_min:]
+    D = np.sum(n * msd) / (2 * dim * np.sum(n * n))
+    (alpha, log_K), cov = np.polyfit(np.log(n), np.log(msd), 1, cov=True)
+    return {'D': D, 'alpha': alpha, 'alpha_err': np.sqrt(cov[0, 0]), 'K': np.exp(log_K)}
+
+def analyze_scaling(n_walkers, n_steps, step_length, seed=None, n_workers=1):
+    """Whole MSD scaling curve and diffusion fit from a single ensemble pass."""
+    print(f"--- MSD Curves from {n_walkers} Walks of {n_steps} Steps ---")
+    curves = msd_curves(n_walkers, n_steps, step_length, seed=seed, n_workers=n_workers)
+    fit = fit_diffusion(curves['n'], curves['msd'])
+    print(f"Diffusion coefficient D: {fit['D']:.4f} (theory l^2/4 = {step_length**2 / 4:.4f})")
+    print(f"Anomalous exponent alpha: {fit['alpha']:.4f} ± {fit['alpha_err']:.4f} (theory 1)")
+    print(f"Non-Gaussian parameter at n={n_steps}: {curves['non_gaussian'][-1]:.4f} (Gaussian limit 0)")
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    n = curves['n'][1:]
+    ax1.loglog(n, curves['msd'][1:], label='Simulated <r²>')
+    ax1.loglog(n, 4 * fit['D'] * n, 'k--', label=f"4Dn, D = {fit['D']:.3f}")
+    ax1.set_xlabel('Step n')
+    ax1.set_ylabel('<r²>')
+    ax1.set_title('Mean-Square Displacement')
+    ax1.grid(True)
+    ax1.legend()
+
+    edges = curves['bin_edges']
+    centres = 0.5 * (edges[1:] + edges[:-1])
+    for step in sorted({1, 2, 5, n_steps // 10, n_steps}):
+        if step >= 1:
+            density = curves['hist'][step - 1] / (n_walkers * np.diff(edges))
+            ax2.plot(centres, density, '.-', label=f'n = {step}')
+    ax2.plot(centres, 2 * centres * np.exp(-centres**2), 'k--', label='Rayleigh (large n)')
+    ax2.set_xlabel('r / (l √n)')
+    ax2.set_ylabel('Probability density')
+    ax2.set_title('Displacement Distribution')
+    ax2.grid(True)
+    ax2.legend()
+    plt.tight_layout()
+    plt.show()
+    return curves, fit
+
+def first_passage(n_walkers, step_length=1.0, boundary='circle', size=10.0, start=(0.0, 0.0),
+                  max_steps=10**6, seed=None, rng=None, block_steps=256, max_block_steps=4096,
+                  memory_budget=2**26):
+    """
+    First-passage times of 2D random walks to an absorbing boundary.
+
+    boundary='circle' absorbs walkers once their distance from the origin
+    reaches size (the radius); boundary='strip' absorbs them once |x| reaches
+    size / 2 (a strip of width size along y).
+
+    Live walkers advance together in vectorized blocks of steps. After each
+    block the absorbed walkers are retired by compacting the active arrays, so
+    the work tracks the number of walkers still alive. The block length grows
+    as walkers retire, keeping one block within memory_budget bytes, but never
+    beyond max_block_steps: a walker absorbed early in a block still costs the
+    rest of that block. Hit times and exit positions go into preallocated
+    result arrays.
+
+    Returns a dict with 'hit_time' (steps, -1 if still alive after max_steps),
+    'exit_x', 'exit_y' (NaN if not absorbed) and 'survivors'.
+    """
+    if boundary == 'circle':
+        absorbed = lambda x, y: x * x + y * y >= size * size
+    elif boundary == 'strip':
+        absorbed = lambda x, y: np.abs(x) >= size / 2
+    else:
+        raise ValueError(f"Unknown boundary '{boundary}', expected 'circle' or 'strip'")
+    rng = np.random.default_rng(seed) if rng is None else rng
+
+    hit_time = np.full(n_walkers, -1, dtype=np.int64)
+    exit_x = np.full(n_walkers, np.nan)
+    exit_y = np.full(n_walkers, np.nan)
+
+    # Active set: walker ids and their current positions
+    ids = np.arange(n_walkers)
+    x = np.full(n_walkers, float(start[0]))
+    y = np.full(n_walkers, float(start[1]))
+    t = 0
+    while ids.size and t < max_steps:
+        n_steps = min(max(block_steps, memory_budget // (40 * ids.size)), max_block_steps, max_steps - t)
+        px, py = _walk_block(rng, ids.size, n_steps, step_length, True)
+        px += x[:, None]
+        py += y[:, None]
+        hit = absorbed(px[:, 1:], py[:, 1:])
+        done = hit.any(axis=1)
+        rows = np.flatnonzero(done)
+        first = hit[rows].argmax(axis=1) + 1
+        hit_time[ids[rows]] = t + first
+        exit_x[ids[rows]] = px[rows, first]
+        exit_y[ids[rows]] = py[rows, first]
+
+        # Retire absorbed walkers
+        alive = ~done
+        ids = ids[alive]
+        x = px[alive, -1]
+        y = py[alive, -1]
+        t += n_steps
+    return {'hit_time': hit_time, 'exit_x': exit_x, 'exit_y': exit_y, 'survivors': ids.size}
+
+def analyze_first_passage(n_walkers, step_length, radius, strip_width, seed=None):
+    """First-passage time distributions to an absorbing circle and strip, started at the origin."""
+    print(f"--- First Passage of {n_walkers} Walkers (Step Length: {step_length}) ---")
+    circle = first_passage(n_walkers, step_length, 'circle', radius, seed=seed)
+    strip = first_passage(n_walkers, step_length, 'strip', strip_width, seed=seed)
+
+    # Walkers still alive after max_steps (hit_time -1) are censored, not averaged in
+    circle_times = circle['hit_time'][circle['hit_time'] >= 0]
+    strip_times = strip['hit_time'][strip['hit_time'] >= 0]
+
+    # Diffusive estimates (ignoring overshoot): <r^2> = n l^2 and <x^2> = n l^2 / 2
+    print(f"Circle R={radius}: mean hit time {circle_times.mean():.1f} steps "
+          f"(diffusion estimate R^2/l^2 = {radius**2 / step_length**2:.1f}), "
+          f"{circle['survivors']} censored")
+    print(f"Strip w={strip_width}: mean hit time {strip_times.mean():.1f} steps "
+          f"(diffusion estimate w^2/(2 l^2) = {strip_width**2 / (2 * step_length**2):.1f}), "
+          f"{strip['survivors']} censored")
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    ax1.hist(circle_times, bins=100, density=True, alpha=0.6, label=f'Circle (R = {radius})')
+    ax1.hist(strip_times, bins=100, density=True, alpha=0.6, label=f'Strip (w = {strip_width})')
+    ax1.set_xlabel('First-passage time (steps)')
+    ax1.set_ylabel('Probability density')
+    ax1.set_title('First-Passage Time Distribution')
+    ax1.grid(True)
+    ax1.legend()
+
+    exited = circle['hit_time'] >= 0
+    ax2.hist(np.degrees(np.arctan2(circle['exit_y'][exited], circle['exit_x'][exited])), bins=72, density=True)
+    ax2.set_xlabel('Exit angle (degrees)')
+    ax2.set_ylabel('Probability density')
+    ax2.set_title('Exit Locations on the Circle')
+    ax2.grid(True)
+    plt.tight_layout()
+    plt.show()
+    return circle, strip
+
+def simulate_and_analyze_walk(n_steps, step_length, n_simulations, rng=None, n_workers=1):
     """
     Simulates 2D random walks with variable step length, plots one example, 
     and calculates distances.
@@ -16,24 +282,16 @@ def simulate_and_analyze_walk(n_steps, step_length, n_simulations):
         n_steps (int): The number of steps for each random walk.
         step_length (float): The length of each individual step.
         n_simulations (int): The number of walks to simulate for averaging.
+        rng: Source of random numbers (a numpy Generator or a
+            PRNG.HomegrownBitGenerator); defaults to a fresh numpy Generator.
+        n_workers (int): Processes used for the ensemble of walks.
     """
     # --- 1. Simulate and Plot a Single Random Walk ---
     print(f"--- Simulating a Single Walk with {n_steps} Steps (Length: {step_length}) ---")
     
-    # Start at the origin (0,0)
-    x_positions = [0]
-    y_positions = [0]
-    
-    # Perform the walk
-    for _ in range(n_steps):
-        angle = 2 * math.pi * np.random.random()
-        
-        # Take a step of length 'step_length' in that direction
-        x_step = step_length * math.cos(angle)
-        y_step = step_length * math.sin(angle)
-        
-        x_positions.append(x_positions[-1] + x_step)
-        y_positions.append(y_positions[-1] + y_step)
+    # Perform the walk, starting at the origin (0,0)
+    x_paths, y_paths = simulate_walk_ensemble(1, n_steps, step_length, rng=rng, return_paths=True)
+    x_positions, y_positions = x_paths[0], y_paths[0]
 
     # --- 2. Draw the Schematic Diagram ---
     plt.figure(figsize=(8, 8))
@@ -57,15 +315,9 @@ def simulate_and_analyze_walk(n_steps, step_length, n_simulations):
 
     # --- 4. Calculate Average Distance over Many Simulations ---
     print(f"--- Simulating {n_simulations} Walks to Find Average Distance ---")
-    final_distances = []
-    
-    for _ in range(n_simulations):
-        x, y = 0, 0
-        for _ in range(n_steps):
-            angle = 2 * math.pi * np.random.random()
-            x += step_length * math.cos(angle)
-            y += step_length * math.sin(angle)
-        final_distances.append(math.sqrt(x**2 + y**2))
+    final_x, final_y = simulate_walk_ensemble(n_simulations, n_steps, step_length,
+                                              rng=rng, n_workers=n_workers)
+    final_distances = np.hypot(final_x, final_y)
         
     average_distance = np.mean(final_distances)
     
@@ -75,13 +327,25 @@ def simulate_and_analyze_walk(n_steps, step_length, n_simulations):
     print(f"Simulated Average Distance over {n_simulations} walks: {average_distance:.4f}")
     print(f"Theoretical RMS Distance (l * sqrt(N)): {theoretical_distance:.4f}")
 
-# --- User-Defined Values ---
+if __name__ == "__main__":
+    clear_screen()
+    # --- User-Defined Values ---
+
+    # Let's use fewer steps to make the plot clearer
+    N = 200
 
-# Let's use fewer steps to make the plot clearer
-N = 200
+    # Increase the step length to increase the spread
+    L = 5.0 
 
-# Increase the step length to increase the spread
-L = 5.0 
+    # Run the simulation with the new step length
+    simulate_and_analyze_walk(n_steps=N, step_length=L, n_simulations=5000)
+
+    print("\n" + "="*50 + "\n")
+
+    # Whole scaling curve <r^2>(n) from one ensemble pass
+    analyze_scaling(n_walkers=5000, n_steps=N, step_length=L)
+
+    print("\n" + "="*50 + "\n")
 
-# Run the simulation with the new step length
-simulate_and_analyze_walk(n_steps=N, step_length=L, n_simulations=5000)
\ No newline at end of file
+    # First-passage times to absorbing boundaries
+    analyze_first_passage(n_walkers=20000, step_length=L, radius=20 * L, strip_width=20 * L)
\ No newline at end of file
@@ -1,6 +1,10 @@
 # Aim: Perform the RK 2nd, 3rd and 4th order methods to solve the ODE for Newton's law of cooling using Python Programming
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.linalg import lu_factor, lu_solve
+import time
+import json
+import csv
 
 import os
 def clear_screen():
@@ -18,69 +22,520 @@ while True:
         dt = 0.1    # Time step
         return T0, t0, t_end, dt,k
     
-    def exact_solution(t, T0):
-        T_env = 27  # Ambient temperature/Room Temperature
-        k = 0.2     # Cooling constant
-        T = T_env + (T0 - T_env) * np.exp(-k * t)
+    def exact_solution(t, T0, k, t0=0, T_env=27):
+        # T_env: Ambient temperature/Room Temperature, k: Cooling constant
+        T = T_env + (T0 - T_env) * np.exp(-k * (t - t0))
         return T
     
-    def RK_2nd_order(f, T0, t0, t_end, dt):
+    # Butcher tableaux: stage times c, stage coefficients a (lower triangular), weights b
+    RK2_TABLEAU = {'name': "RK 2nd Order (Heun)",
+                   'c': np.array([0, 1]),
+                   'a': np.array([[0, 0],
+                                  [1, 0]]),
+                   'b': np.array([1/2, 1/2])}
+    RK3_TABLEAU = {'name': "RK 3rd Order (Kutta)",
+                   'c': np.array([0, 1/2, 1]),
+                   'a': np.array([[0, 0, 0],
+                                  [1/2, 0, 0],
+                                  [-1, 2, 0]]),
+                   'b': np.array([1/6, 2/3, 1/6])}
+    RK4_TABLEAU = {'name': "RK 4th Order (Classic)",
+                   'c': np.array([0, 1/2, 1/2, 1]),
+                   'a': np.array([[0, 0, 0, 0],
+                                  [1/2, 0, 0, 0],
+                                  [0, 1/2, 0, 0],
+                                  [0, 0, 1, 0]]),
+                   'b': np.array([1/6, 1/3, 1/3, 1/6])}
+
+    def rk_integrate(f, y0, t0, t_end, dt, tableau):
+        """
+        Explicit Runge-Kutta integration driven by a Butcher tableau.
+        y0 may be a scalar or an array of any shape (many initial temperatures,
+        many cooling constants, or a vector ODE system) and f(t, y) must
+        return an array of the same shape. The stage buffers are allocated
+        once and reused at every step. Returns t (n,) and y (n, *y0.shape).
+        """
+        a, b, c = tableau['a'], tableau['b'], tableau['c']
         n = int((t_end - t0) / dt) + 1
         t = np.linspace(t0, t_end, n)
-        T = np.zeros(n)
-        T[0] = T0
+        h = t[1] - t[0] if n > 1 else dt
+        y0 = np.asarray(y0, dtype=float)
+        y = np.empty((n,) + y0.shape)
+        y[0] = y0
+        K = np.empty((len(b),) + y0.shape)   # stage derivatives
+        stage = np.empty(y0.shape)           # stage state
+        scratch = np.empty(y0.shape)
         for i in range(1, n):
-            k1 = f(t[i-1], T[i-1])
-            k2 = f(t[i-1] + dt, T[i-1] + dt * k1)
-            T[i] = T[i-1] + (dt / 2) * (k1 + 2*k2)
-        return t, T
+            for s in range(len(b)):
+                stage[...] = y[i-1]
+                for j in range(s):
+                    if a[s, j] != 0:
+                        np.multiply(K[j], h * a[s, j], out=scratch)
+                        stage += scratch
+                K[s] = f(t[i-1] + c[s] * h, stage)
+            y[i] = y[i-1]
+            for j in range(len(b)):
+                np.multiply(K[j], h * b[j], out=scratch)
+                y[i] += scratch
+        return t, y
+
+    def RK_2nd_order(f, T0, t0, t_end, dt):
+        return rk_integrate(f, T0, t0, t_end, dt, RK2_TABLEAU)
     
     def RK_3rd_order(f, T0, t0, t_end, dt):
-        n = int((t_end - t0) / dt) + 1
-        t = np.linspace(t0, t_end, n)
-        T = np.zeros(n)
-        T[0] = T0
-        for i in range(1, n):
-            k1 = f(t[i-1], T[i-1])
-            k2 = f(t[i-1] + dt / 2, T[i-1] + (dt / 2) * k1)
-            k3 = f(t[i-1] + dt, T[i-1] + dt * k2)
-            T[i] = T[i-1] + (dt / 4) * (k1 + 2 * (k2 + k3))
-        return t, T
+        return rk_integrate(f, T0, t0, t_end, dt, RK3_TABLEAU)
     
     def RK_4th_order(f, T0, t0, t_end, dt):
-        n = int((t_end - t0) / dt) + 1
-        t = np.linspace(t0, t_end, n)
-        T = np.zeros(n)
-        T[0] = T0
-        for i in range(1, n):
-            k1 = f(t[i-1], T[i-1])
-            k2 = f(t[i-1] + dt / 2, T[i-1] + (dt / 2) * k1)
-            k3 = f(t[i-1] + dt / 2, T[i-1] + (dt / 2) * k2)
-            k4 = f(t[i-1] + dt, T[i-1] + dt * k3)
-            T[i] = T[i-1] + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
-        return t, T
+        return rk_integrate(f, T0, t0, t_end, dt, RK4_TABLEAU)
     
+    # Embedded pairs: weights b advance the solution, e = b - b_hat estimates the
+    # local error (last entry multiplies f at the new point, reused as the next
+    # first stage), and p gives the dense output polynomial
+    BS23_TABLEAU = {'name': "Bogacki-Shampine 3(2)", 'error_order': 2,
+                    'c': np.array([0, 1/2, 3/4]),
+                    'a': np.array([[0, 0, 0],
+                                   [1/2, 0, 0],
+                                   [0, 3/4, 0]]),
+                    'b': np.array([2/9, 1/3, 4/9]),
+                    'e': np.array([5/72, -1/12, -1/9, 1/8]),
+                    'p': np.array([[1, -4/3, 5/9],
+                                   [0, 1, -2/3],
+                                   [0, 4/3, -8/9],
+                                   [0, -1, 1]])}
+    DOPRI5_TABLEAU = {'name': "Dormand-Prince 5(4)", 'error_order': 4,
+                      'c': np.array([0, 1/5, 3/10, 4/5, 8/9, 1]),
+                      'a': np.array([[0, 0, 0, 0, 0],
+                                     [1/5, 0, 0, 0, 0],
+                                     [3/40, 9/40, 0, 0, 0],
+                                     [44/45, -56/15, 32/9, 0, 0],
+                                     [19372/6561, -25360/2187, 64448/6561, -212/729, 0],
+                                     [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]]),
+                      'b': np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]),
+                      'e': np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200, -22/525, 1/40]),
+                      'p': np.array([[1, -8048581381/2820520608, 8663915743/2820520608,
+                                      -12715105075/11282082432],
+                                     [0, 0, 0, 0],
+                                     [0, 131558114200/32700410799, -68118460800/10900136933,
+                                      87487479700/32700410799],
+                                     [0, -1754552775/470086768, 14199869525/1410260304,
+                                      -10690763975/1880347072],
+                                     [0, 127303824393/49829197408, -318862633887/49829197408,
+                                      701980252875/199316789632],
+                                     [0, -282668133/205662961, 2019193451/616988883,
+                                      -1453857185/822651844],
+                                     [0, 40617522/29380423, -110615467/29380423,
+                                      69997945/29380423]])}
+
+    def rk_adaptive(f, y0, t0, t_end, tableau, rtol=1e-6, atol=1e-9, h0=None, max_steps=10**6):
+        """
+        Adaptive step-size integration with an embedded Runge-Kutta pair.
+        Each step's local error estimate is compared with atol + rtol*|y|
+        (RMS over all components of an array state) and the next step size is
+        chosen from it. Returns a dict with the accepted step times 't' and
+        states 'y', the dense output coefficients 'Q' (see dense_output), and
+        the counts 'n_accepted', 'n_rejected' and 'nfev'.
+        Raises RuntimeError if the error estimate is not finite, if the step
+        falls below 10*eps*|t| (e.g. at a blow-up), or after max_steps
+        attempted steps.
+        """
+        a, b, c, e, P = tableau['a'], tableau['b'], tableau['c'], tableau['e'], tableau['p']
+        exponent = -1 / (tableau['error_order'] + 1)
+        s = len(b)
+        t = t0
+        y = np.array(y0, dtype=float)
+        K = np.empty((s + 1,) + y.shape)
+        stage = np.empty(y.shape)
+        K[0] = f(t, y)
+        nfev = 1
+        if h0 is None:
+            scale = atol + rtol * np.abs(y)
+            d0 = np.sqrt(np.mean((y / scale)**2))
+            d1 = np.sqrt(np.mean((K[0] / scale)**2))
+            h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h = min(h0, t_end - t0)
+
+        t_steps, y_steps, Q_steps = [t], [y.copy()], []
+        n_accepted = n_rejected = 0
+        while t < t_end:
+            if n_accepted + n_rejected >= max_steps:
+                raise RuntimeError(f"rk_adaptive reached max_steps = {max_steps} at t = {t:.4g}")
+            h = min(h, t_end - t)
+            if h < 10 * np.finfo(float).eps * max(abs(t), 1e-300):
+                raise RuntimeError(f"Step size fell below 10*eps*|t| at t = {t:.4g}")
+            for i in range(1, s):
+                stage[...] = y + h * np.tensordot(a[i, :i], K[:i], axes=1)
+                K[i] = f(t + c[i] * h, stage)
+            y_new = y + h * np.tensordot(b, K[:s], axes=1)
+            K[s] = f(t + h, y_new)
+            nfev += s
+
+            error = h * np.tensordot(e, K, axes=1)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            error_norm = np.sqrt(np.mean((error / scale)**2))
+            if not np.isfinite(error_norm):
+                raise RuntimeError(f"Non-finite error estimate at t = {t:.4g}; the solution may blow up")
+            if error_norm <= 1:
+                Q_steps.append(np.tensordot(P.T, K, axes=1))
+                t += h
+                y = y_new
+                K[0] = K[s]  # First same as last
+                t_steps.append(t)
+                y_steps.append(y.copy())
+                n_accepted += 1
+                factor = 10 if error_norm == 0 else min(10, 0.9 * error_norm**exponent)
+            else:
+                n_rejected += 1
+                factor = max(0.2, 0.9 * error_norm**exponent)
+            h *= factor
+        return {'name': tableau['name'], 't': np.array(t_steps), 'y': np.array(y_steps),
+                'Q': np.array(Q_steps), 'n_accepted': n_accepted, 'n_rejected': n_rejected,
+                'nfev': nfev}
+
+    def dense_output(solution, t_eval):
+        """Evaluate an rk_adaptive solution at any times in [t0, t_end] without extra steps."""
+        t_steps, y_steps, Q = solution['t'], solution['y'], solution['Q']
+        t_eval = np.asarray(t_eval, dtype=float)
+        i = np.clip(np.searchsorted(t_steps, t_eval, side='right') - 1, 0, len(t_steps) - 2)
+        h = t_steps[i + 1] - t_steps[i]
+        x = (t_eval - t_steps[i]) / h
+        powers = np.cumprod(np.repeat(x[:, None], Q.shape[1], axis=1), axis=1)
+        extra = (1,) * (y_steps.ndim - 1)
+        y = y_steps[i] + h.reshape(h.shape + extra) * np.einsum('mk,mk...->m...', powers, Q[i])
+        return y
+
     def cooling_ode(t, T, k, T_env=27):
         T_env = 27  # Ambient temperature
         return -k * (T - T_env)
     
+    def cooling_sweep(T0_values, k_values, t0, t_end, dt, tableau=RK4_TABLEAU):
+        """Solve every (T0, k) pair at once as one array state of shape (len(T0_values), len(k_values))."""
+        T0_grid, k_grid = np.meshgrid(np.asarray(T0_values, dtype=float),
+                                      np.asarray(k_values, dtype=float), indexing='ij')
+        return rk_integrate(lambda t, T: cooling_ode(t, T, k_grid), T0_grid, t0, t_end, dt, tableau)
+    
+    def Adaptive_plot(T0, t0, t_end, dt, k, rtol=1e-6, atol=1e-9):
+        f = lambda t, T: cooling_ode(t, T, k)
+        exact = lambda t: exact_solution(t, T0, k, t0)
+        t_fine = np.linspace(t0, t_end, 1000)
+        print(f"{'Method':<26}{'Accepted':>10}{'Rejected':>10}{'f evals':>10}{'Max error':>12}")
+        for tableau in (RK2_TABLEAU, RK3_TABLEAU, RK4_TABLEAU):
+            t, T = rk_integrate(f, T0, t0, t_end, dt, tableau)
+            print(f"{tableau['name']:<26}{len(t) - 1:>10}{0:>10}{len(tableau['b']) * (len(t) - 1):>10}"
+                  f"{np.max(np.abs(T - exact(t))):>12.2e}")
+        solutions = [rk_adaptive(f, T0, t0, t_end, tableau, rtol, atol)
+                     for tableau in (BS23_TABLEAU, DOPRI5_TABLEAU)]
+        for sol in solutions:
+            error = np.max(np.abs(dense_output(sol, t_fine) - exact(t_fine)))
+            print(f"{sol['name']:<26}{sol['n_accepted']:>10}{sol['n_rejected']:>10}{sol['nfev']:>10}"
+                  f"{error:>12.2e}")
+
+        fig, ax = plt.subplots(1, 2, figsize=(18, 8), constrained_layout=True)
+        ax[0].plot(t_fine, exact(t_fine), 'k--', label='Exact Solution')
+        for sol in solutions:
+            ax[0].plot(t_fine, dense_output(sol, t_fine), label=f"{sol['name']} (dense output)")
+            ax[0].plot(sol['t'], sol['y'], 'o', markersize=4, label=f"{sol['name']} steps")
+            ax[1].plot(sol['t'][1:], np.diff(sol['t']), 'o-', markersize=3, label=sol['name'])
+        ax[0].set_xlabel('Time (minutes)')
+        ax[0].set_ylabel('Temperature (°C)')
+        ax[0].legend()
+        ax[0].grid()
+        ax[1].set_xlabel('Time (minutes)')
+        ax[1].set_ylabel('Step size (minutes)')
+        ax[1].set_yscale('log')
+        ax[1].legend()
+        ax[1].grid()
+        plt.suptitle(f"Adaptive Step Size (rtol = {rtol:g}, atol = {atol:g})", fontsize=16)
+        plt.show()
+
+    def thermal_network_ode(n_bodies, k_couple, k_env, T_env=27):
+        """
+        Chain of n_bodies exchanging heat with their neighbours (k_couple) and
+        with the room (k_env). Large k_couple / k_env makes the system stiff.
+        Returns f(t, T) and its constant Jacobian.
+        """
+        J = (np.diag(np.full(n_bodies - 1, k_couple), -1) + np.diag(np.full(n_bodies - 1, k_couple), 1)
+             - np.diag(np.full(n_bodies, k_env) + k_couple * np.r_[1, np.full(n_bodies - 2, 2), 1]))
+        return (lambda t, T: J @ T + k_env * T_env), (lambda t, T: J)
+
+    def decay_chain_ode(decay_constants):
+        """
+        Radioactive decay chain N0 -> N1 -> ... (last entry stable if its
+        constant is 0). Widely different half-lives make the system stiff.
+        Returns f(t, N) and its constant Jacobian.
+        """
+        lam = np.asarray(decay_constants, dtype=float)
+        J = np.diag(-lam) + np.diag(lam[:-1], -1)
+        return (lambda t, N: J @ N), (lambda t, N: J)
+
+    def finite_difference_jacobian(f, t, y, f0):
+        """Forward-difference Jacobian of f at (t, y); costs len(y) evaluations."""
+        J = np.empty((y.size, y.size))
+        for i in range(y.size):
+            delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[i]))
+            y_shift = y.copy()
+            y_shift[i] += delta
+            J[:, i] = (f(t, y_shift) - f0) / delta
+        return J
+
+    def implicit_integrate(f, y0, t0, t_end, dt, method='trbdf2', jac=None, tol=1e-10,
+                           max_newton=10, jac_refresh=50):
+        """
+        Fixed-step implicit integration for stiff problems, with the same
+        f(t, y) interface as cooling_ode. method is 'backward_euler',
+        'trbdf2' or 'rosenbrock' (the L-stable ROS2 method).
+
+        Every stage solves with the matrix I - gamma*h*J. Its LU factorization
+        is computed once and reused across steps, and is refreshed every
+        jac_refresh steps or when Newton's iteration stalls. J comes from
+        jac(t, y) if given, else from finite differences.
+        Returns t (n,), y (n, *y0.shape) and counts of f evaluations,
+        Jacobians and LU factorizations.
+        """
+        gamma = {'backward_euler': 1.0,
+                 'trbdf2': 1 - np.sqrt(2) / 2,
+                 'rosenbrock': 1 + np.sqrt(2) / 2}[method]
+        n = int((t_end - t0) / dt) + 1
+        t = np.linspace(t0, t_end, n)
+        h = t[1] - t[0] if n > 1 else dt
+        shape = np.shape(y0)
+        fun = lambda t, y: np.reshape(f(t, y.reshape(shape)), -1)
+        y = np.empty((n, int(np.prod(shape))))
+        y[0] = np.ravel(y0)
+        stats = {'nfev': 0, 'njev': 0, 'nlu': 0}
+        lu = None
+
+        def factorize(ti, yi, fi):
+            nonlocal lu
+            if jac is not None:
+                J = np.atleast_2d(jac(ti, yi.reshape(shape)))
+            else:
+                J = finite_difference_jacobian(fun, ti, yi, fi)
+                stats['nfev'] += yi.size
+            stats['njev'] += 1
+            lu = lu_factor(np.eye(yi.size) - gamma * h * J)
+            stats['nlu'] += 1
+
+        def newton(ti, z, rhs):
+            """Solve z - gamma*h*f(ti, z) = rhs by simplified Newton with the stored LU."""
+            for attempt in range(2):
+                zi = z.copy()
+                for _ in range(max_newton):
+                    fz = fun(ti, zi)
+                    stats['nfev'] += 1
+                    dz = lu_solve(lu, rhs - zi + gamma * h * fz)
+                    zi += dz
+                    if np.linalg.norm(dz) <= tol * (1 + np.linalg.norm(zi)):
+                        return zi
+                factorize(ti, z, fun(ti, z))  # Stalled: refresh the Jacobian and retry
+                stats['nfev'] += 1
+            raise RuntimeError(f"Newton iteration did not converge at t = {ti:.4g}")
+
+        for i in range(1, n):
+            yi = y[i-1]
+            fi = fun(t[i-1], yi)
+            stats['nfev'] += 1
+            if lu is None or (i - 1) % jac_refresh == 0:
+                factorize(t[i-1], yi, fi)
+            if method == 'backward_euler':
+                y[i] = newton(t[i], yi, yi)
+            elif method == 'trbdf2':
+                g = 2 - np.sqrt(2)
+                # Trapezoidal stage to t + g*h, then BDF2 stage to t + h (same matrix)
+                z = newton(t[i-1] + g * h, yi, yi + gamma * h * fi)
+                y[i] = newton(t[i], z, (z - (1 - g)**2 * yi) / (g * (2 - g)))
+            else:
+                k1 = lu_solve(lu, fi)
+                k2 = lu_solve(lu, fun(t[i], yi + h * k1) - 2 * k1)
+                stats['nfev'] += 1
+                y[i] = yi + 1.5 * h * k1 + 0.5 * h * k2
+        return t, y.reshape((n,) + shape), stats
+
+    def Stiff_plot(T0, t0, t_end, dt, k):
+        f = lambda t, T: cooling_ode(t, T, k)
+        exact = lambda t: exact_solution(t, T0, k, t0)
+        print(f"Stiffness k*dt = {k * dt:.3g} (explicit RK4 is stable only below about 2.8)")
+        print(f"{'Method':<20}{'Steps':>8}{'f evals':>10}{'LU':>6}{'Max error':>12}")
+        fig, ax = plt.subplots(1, 2, figsize=(18, 8), constrained_layout=True)
+        with np.errstate(all='ignore'):
+            # Explicit RK4 is expected to blow up here; keep the overflow quiet
+            t4, T4 = rk_integrate(f, T0, t0, t_end, dt, RK4_TABLEAU)
+            print(f"{'RK 4th Order':<20}{len(t4) - 1:>8}{4 * (len(t4) - 1):>10}{0:>6}"
+                  f"{np.max(np.abs(T4 - exact(t4))):>12.2e}")
+        for method in ('backward_euler', 'trbdf2', 'rosenbrock'):
+            t, T, stats = implicit_integrate(f, T0, t0, t_end, dt, method)
+            print(f"{method:<20}{len(t) - 1:>8}{stats['nfev']:>10}{stats['nlu']:>6}"
+                  f"{np.max(np.abs(T - exact(t))):>12.2e}")
+            ax[0].plot(t, T, 'o-', markersize=2, label=method)
+        ax[0].plot(t4, np.clip(T4, -1e3, 1e3), 'x-', markersize=2, label='RK 4th Order')
+        ax[0].plot(t4, exact(t4), 'k--', label='Exact Solution')
+        ax[0].set_ylim(0, T0 + 5)
+        ax[0].set_xlabel('Time (minutes)')
+        ax[0].set_ylabel('Temperature (°C)')
+        ax[0].set_title(f'Single body, k = {k}')
+        ax[0].legend()
+        ax[0].grid()
+
+        # Stiff coupled network: 20 bodies in a chain, first one starting hot
+        f_net, jac_net = thermal_network_ode(20, k_couple=100 * k, k_env=k)
+        T_init = np.full(20, 27.0)
+        T_init[0] = T0
+        t, T, stats = implicit_integrate(f_net, T_init, t0, t_end, dt, 'trbdf2', jac=jac_net)
+        print(f"Thermal network (20 bodies, TR-BDF2): {len(t) - 1} steps, {stats['nfev']} f evals, "
+              f"{stats['nlu']} LU factorizations")
+        for j in range(0, 20, 4):
+            ax[1].plot(t, T[:, j], label=f'Body {j + 1}')
+        ax[1].set_xlabel('Time (minutes)')
+        ax[1].set_ylabel('Temperature (°C)')
+        ax[1].set_title('Coupled thermal network (TR-BDF2)')
+        ax[1].legend()
+        ax[1].grid()
+        plt.suptitle("Implicit Solvers for Stiff Cooling", fontsize=16)
+        plt.show()
+
+    def work_precision(T0, t0, t_end, k, dt_values=None, rtol_values=None, repeats=3):
+        """
+        Work-precision benchmark on the cooling ODE. Every fixed-step
+        integrator runs over dt_values and the adaptive pairs over
+        rtol_values. Each row records the max error against the exact
+        solution, the best wall time of `repeats` runs and the number of
+        f evaluations.
+        """
+        if dt_values is None:
+            dt_values = (t_end - t0) / np.unique(np.logspace(1, 4, 13).astype(int))
+        if rtol_values is None:
+            rtol_values = np.logspace(-3, -11, 9)
+        fixed = [(tab['name'], lambda f, dt, tab=tab: rk_integrate(f, T0, t0, t_end, dt, tab)[:2])
+                 for tab in (RK2_TABLEAU, RK3_TABLEAU, RK4_TABLEAU)]
+        fixed += [(name, lambda f, dt, m=m: implicit_integrate(f, T0, t0, t_end, dt, m)[:2])
+                  for name, m in (("Backward Euler", 'backward_euler'), ("TR-BDF2", 'trbdf2'),
+                                  ("Rosenbrock (ROS2)", 'rosenbrock'))]
+        adaptive = [(tab['name'], lambda f, rtol, tab=tab: rk_adaptive(f, T0, t0, t_end, tab, rtol, rtol * 1e-3))
+                    for tab in (BS23_TABLEAU, DOPRI5_TABLEAU)]
+
+        def measure(run, param):
+            nfev = 0
+            def f(t, T):
+                nonlocal nfev
+                nfev += 1
+                return cooling_ode(t, T, k)
+            best = np.inf
+            for _ in range(repeats):
+                nfev = 0
+                start = time.perf_counter()
+                out = run(f, param)
+                best = min(best, time.perf_counter() - start)
+            if isinstance(out, dict):
+                t, T = out['t'], out['y']
+            else:
+                t, T = out
+            with np.errstate(all='ignore'):
+                error = float(np.max(np.abs(np.ravel(T) - exact_solution(t, T0, k, t0))))
+            return {'steps': len(t) - 1, 'max_error': error, 'time_s': best, 'nfev': nfev}
+
+        rows = []
+        for name, run in fixed:
+            for dt in dt_values:
+                rows.append({'method': name, 'dt': float(dt), 'rtol': None, **measure(run, dt)})
+        for name, run in adaptive:
+            for rtol in rtol_values:
+                rows.append({'method': name, 'dt': None, 'rtol': float(rtol), **measure(run, rtol)})
+        return rows
+
+    def convergence_orders(rows):
+        """
+        Empirical order of each fixed-step method: slope of log(error) against
+        log(dt) over the finer half of the sweep (the asymptotic range).
+        Points at round-off level (error < 1e-12) or unstable (non-finite)
+        are left out of the fit.
+        """
+        orders = {}
+        for name in dict.fromkeys(r['method'] for r in rows if r['dt'] is not None):
+            pts = [(r['dt'], r['max_error']) for r in rows
+                   if r['method'] == name and np.isfinite(r['max_error']) and r['max_error'] > 1e-12]
+            pts = sorted(pts)[:max(2, (len(pts) + 1) // 2)]
+            if len(pts) >= 2:
+                dt, err = np.log(np.array(pts)).T
+                orders[name] = float(np.polyfit(dt, err, 1)[0])
+        return orders
+
+    def save_benchmark(rows, orders, path):
+        """Writes the benchmark as JSON (rows and fitted orders) or as CSV (rows only), chosen by extension."""
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, 'w') as file:
+                json.dump({'rows': rows, 'orders': orders}, file, indent=2)
+
+    def Benchmark_plot(T0, t0, t_end, k, path='rk_benchmark.json'):
+        rows = work_precision(T0, t0, t_end, k)
+        orders = convergence_orders(rows)
+        print(f"{'Method':<30}{'Fitted order':>14}")
+        for name, order in orders.items():
+            print(f"{name:<30}{order:>14.2f}")
+        save_benchmark(rows, orders, path)
+        save_benchmark(rows, orders, os.path.splitext(path)[0] + '.csv')
+        print(f"Work-precision data written to {path} and {os.path.splitext(path)[0]}.csv")
+
+        fig, ax = plt.subplots(1, 3, figsize=(18, 6), constrained_layout=True)
+        for name in dict.fromkeys(r['method'] for r in rows):
+            sel = [r for r in rows if r['method'] == name and np.isfinite(r['max_error']) and r['max_error'] > 0]
+            err = [r['max_error'] for r in sel]
+            style = 'o-' if sel[0]['dt'] is not None else 's--'
+            if sel[0]['dt'] is not None:
+                label = f"{name} (p = {orders.get(name, np.nan):.2f})"
+                ax[0].loglog([r['dt'] for r in sel], err, style, markersize=3, label=label)
+            ax[1].loglog([r['nfev'] for r in sel], err, style, markersize=3, label=name)
+            ax[2].loglog([r['time_s'] for r in sel], err, style, markersize=3, label=name)
+        for a, xlabel in zip(ax, ('Time step dt', 'Function evaluations', 'Wall time (s)')):
+            a.set_xlabel(xlabel)
+            a.set_ylabel('Max absolute error')
+            a.grid(True, which='both', alpha=0.3)
+        ax[0].set_title('Convergence')
+        ax[1].set_title('Work-precision (evaluations)')
+        ax[2].set_title('Work-precision (time)')
+        ax[0].legend(fontsize=8)
+        ax[1].legend(fontsize=8)
+        plt.suptitle(f"Work-Precision Benchmark (k = {k})", fontsize=16)
+        plt.show()
+        return rows, orders
+
+    def Sweep_plot(T0, t0, t_end, dt, k):
+        T0_values = np.linspace(T0 / 2, T0, 5)
+        k_values = np.linspace(k / 2, 2 * k, 4)
+        t, T = cooling_sweep(T0_values, k_values, t0, t_end, dt)
+        fig, ax = plt.subplots(1, len(k_values), figsize=(18, 6), sharey=True, constrained_layout=True)
+        for j, kj in enumerate(k_values):
+            for i, T0i in enumerate(T0_values):
+                ax[j].plot(t, T[:, i, j], label=f'T0 = {T0i:.1f}°C')
+            ax[j].axhline(y=27, color='r', linestyle='--')
+            ax[j].set_title(f'k = {kj:.3f}')
+            ax[j].set_xlabel('Time (minutes)')
+            ax[j].grid()
+        ax[0].set_ylabel('Temperature (°C)')
+        ax[0].legend()
+        plt.suptitle(f"Parameter Sweep: {T0_values.size * k_values.size} cooling curves in one RK4 run", fontsize=16)
+        plt.show()
+    
     def calculate(T0, t0, t_end, dt, k):
         t_exact = np.linspace(t0, t_end, 100)
-        T_exact = exact_solution(t_exact, T0)      
+        T_exact = exact_solution(t_exact, T0, k, t0)
         f = lambda t, T: cooling_ode(t, T, k)  
         t2, T2 = RK_2nd_order(f, T0, t0, t_end, dt)
         t3, T3 = RK_3rd_order(f, T0, t0, t_end, dt)
         t4, T4 = RK_4th_order(f, T0, t0, t_end, dt)
         return  t2, T2, t3, T3, t4, T4, t_exact, T_exact
     
-    def Error(t2, T2, t3, T3, t4, T4, T0):
-        E2 = np.abs(T2 - exact_solution(t2, T0))
-        E3 = np.abs(T3 - exact_solution(t3, T0))
-        E4 = np.abs(T4 - exact_solution(t4, T0))
+    def Error(t2, T2, t3, T3, t4, T4, T0, k, t0):
+        E2 = np.abs(T2 - exact_solution(t2, T0, k, t0))
+        E3 = np.abs(T3 - exact_solution(t3, T0, k, t0))
+        E4 = np.abs(T4 - exact_solution(t4, T0, k, t0))
         return E2, E3, E4
     
-    def Error_plot(t2, T2, t3, T3, t4, T4, T0):
-        E2, E3, E4 = Error(t2, T2, t3, T3, t4, T4, T0)
+    def Error_plot(t2, T2, t3, T3, t4, T4, T0, k, t0):
+        E2, E3, E4 = Error(t2, T2, t3, T3, t4, T4, T0, k, t0)
         fig, ax = plt.subplots(1, 2, figsize=(18, 14), constrained_layout=True)
         ax[0].plot(t2, T2, 'o-' , label='RK 2nd Order', markersize=1.5)
         ax[0].plot(t3, T3, 'o-' , label='RK 3rd Order', markersize=1.5)
@@ -138,15 +593,22 @@ while True:
         plt.show()
         return t2, T2, t3, T3, t4, T4
     
-    def animate_solution(t2, T2, t3, T3, t4, T4):
-        E2,E3,E4 = Error(t2, T2, t3, T3, t4, T4, T0)
+    def playback_times(t_start, t_end, fps=30, duration=10.0):
+        """
+        Simulation time shown in each animation frame, so that t_start..t_end
+        plays in about duration seconds at fps frames per second whatever
+        the solver step dt.
+        """
+        return np.linspace(t_start, t_end, int(np.ceil(duration * fps)) + 1)
+
+    def animate_solution(t2, T2, t3, T3, t4, T4, fps=30, duration=10.0):
+        E2,E3,E4 = Error(t2, T2, t3, T3, t4, T4, T0, k, t0)
         import matplotlib.animation as animation
-        N_steps = (int)(t_end/dt)
         fig, ax = plt.subplots(1,2,figsize=(10, 6), constrained_layout=True)
-        line2,= ax[0].plot(t2, T2, 'o-', label='RK 2nd Order', markersize=1.5)
-        line3, = ax[0].plot(t3, T3, 'o-', label='RK 3rd Order' , markersize=1.5)
-        line4, = ax[0].plot(t4, T4, 'o-', label='RK 4th Order' , markersize=1.5)
-        ax[0].set_xlim(0, t_end)
+        line2,= ax[0].plot([], [], 'o-', label='RK 2nd Order', markersize=1.5)
+        line3, = ax[0].plot([], [], 'o-', label='RK 3rd Order' , markersize=1.5)
+        line4, = ax[0].plot([], [], 'o-', label='RK 4th Order' , markersize=1.5)
+        ax[0].set_xlim(t0, t_end)
         ax[0].set_ylim(0, T0+5)
         ax[0].set_xlabel("Time (minutes)")
         ax[0].set_ylabel("Temperature (°C)")
@@ -154,27 +616,31 @@ while True:
         
         ax[0].grid()
         ax[0].legend()       
-        Error_line2, = ax[1].plot(t2, E2, 'o-' , label='RK2 Error', markersize=1.5)
-        Error_line3, =  ax[1].plot(t3, E3, 'o-', label='RK3 Error', markersize=1.5)
-        Error_line4, = ax[1].plot(t4, E4, 'o-', label='RK4 Error', markersize=1.5)
-        ax[1].set_xlim(0, t_end)
+        Error_line2, = ax[1].plot([], [], 'o-' , label='RK2 Error', markersize=1.5)
+        Error_line3, =  ax[1].plot([], [], 'o-', label='RK3 Error', markersize=1.5)
+        Error_line4, = ax[1].plot([], [], 'o-', label='RK4 Error', markersize=1.5)
+        ax[1].set_xlim(t0, t_end)
         ax[1].set_ylim(0, max(max(E2),max(E3),max(E4))+1)
         ax[1].set_yscale("linear")
         ax[1].set_xlabel('Time (minutes)')
         ax[1].set_ylabel('Absolute Error')
         ax[1].legend()
         ax[1].grid()
-        
+
+        # Frames follow playback time, not solver steps: each frame draws the steps already
+        # passed plus a point interpolated at its own time; blitting leaves the axes untouched
+        t_frames = playback_times(t0, t_end, fps, duration)
+        curves = [(line2, t2, T2), (line3, t3, T3), (line4, t4, T4),
+                  (Error_line2, t2, E2), (Error_line3, t3, E3), (Error_line4, t4, E4)]
+        passed = [np.searchsorted(t, t_frames, side='right') for _, t, _ in curves]
+        heads = [np.interp(t_frames, t, v) for _, t, v in curves]
+
         def update(frame):
-            line2.set_data(t2[:frame], T2[:frame])
-            line3.set_data(t3[:frame], T3[:frame])
-            line4.set_data(t4[:frame], T4[:frame])
-            Error_line2.set_data(t2[:frame], E2[:frame])
-            Error_line3.set_data(t3[:frame], E3[:frame])
-            Error_line4.set_data(t4[:frame], E4[:frame])
-            return line2, line3, line4, Error_line2, Error_line3, Error_line4
+            for (line, t, v), n, head in zip(curves, passed, heads):
+                line.set_data(np.r_[t[:n[frame]], t_frames[frame]], np.r_[v[:n[frame]], head[frame]])
+            return [line for line, _, _ in curves]
         
-        ani = animation.FuncAnimation(fig, update, frames=N_steps, interval=t_end/2,repeat = False, blit=True)
+        ani = animation.FuncAnimation(fig, update, frames=t_frames.size, interval=1000 / fps, repeat=False, blit=True)
         plt.suptitle("Newton's Law of Cooling Animation", fontsize=16)
         plt.show()
 
@@ -190,6 +656,10 @@ while True:
         print("5. Compare all Methods with Exact solution Plot")
         print("6. Error Plot")
         print("7. Animate Solution")
+        print("8. Parameter Sweep (many T0 and k at once)")
+        print("9. Adaptive Step Size (Dormand-Prince / Bogacki-Shampine)")
+        print("10. Implicit Solvers for Stiff Problems")
+        print("11. Work-Precision Benchmark (writes JSON and CSV)")
         
         choice = int(input("Enter choice: "))
         T0, t0, t_end, dt, k = Input()
@@ -235,11 +705,23 @@ while True:
             Compare_all(t2, T2, t3, T3, t4, T4, t_exact, T_exact)
             
         elif choice == 6:
-            Error_plot(t2, T2, t3, T3, t4, T4, T0)
+            Error_plot(t2, T2, t3, T3, t4, T4, T0, k, t0)
             
         elif choice == 7:
             animate_solution(t2, T2, t3 , T3, t4, T4)
             
+        elif choice == 8:
+            Sweep_plot(T0, t0, t_end, dt, k)
+            
+        elif choice == 9:
+            Adaptive_plot(T0, t0, t_end, dt, k)
+            
+        elif choice == 10:
+            Stiff_plot(T0, t0, t_end, dt, k)
+            
+        elif choice == 11:
+            Benchmark_plot(T0, t0, t_end, k)
+            
         else:
             print("Invalid choice. Please try again.")
             
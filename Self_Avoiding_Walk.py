@@ -0,0 +1,212 @@
+# Aim: To generate long self-avoiding walks on the square and cubic lattices with the pivot algorithm and estimate the Flory exponent
+import numpy as np
+import matplotlib.pyplot as plt
+import itertools
+import time
+
+def lattice_symmetries(dim):
+    """
+    Non-identity symmetries of the square (dim=2) or cubic (dim=3) lattice,
+    i.e. all signed permutation matrices except the identity (7 or 47).
+    """
+    matrices = []
+    for perm in itertools.permutations(range(dim)):
+        for signs in itertools.product((1, -1), repeat=dim):
+            M = np.zeros((dim, dim), dtype=np.int64)
+            M[np.arange(dim), perm] = signs
+            if not np.array_equal(M, np.eye(dim, dtype=np.int64)):
+                matrices.append(M)
+    return np.array(matrices)
+
+class PivotWalk:
+    """
+    Self-avoiding walk of n_steps on the square or cubic lattice, sampled with
+    the pivot algorithm.
+
+    A pivot move picks a site and applies a random lattice symmetry to the
+    shorter part of the walk about that site. The move is accepted if the
+    rotated part does not hit the fixed part. Occupied sites are held in a
+    hash map (site key -> index along the walk). Rotated sites are checked
+    outward from the pivot in growing blocks, so most rejections cost only a
+    few lookups; accepted moves update the map in O(moved sites).
+    """
+
+    def __init__(self, n_steps, dim=2, seed=None):
+        if dim not in (2, 3):
+            raise ValueError("Only the square (dim=2) and cubic (dim=3) lattices are supported")
+        self.n_steps = n_steps
+        self.dim = dim
+        self.rng = np.random.default_rng(seed)
+        self.symmetries = lattice_symmetries(dim)
+        # Every site fits in [-n_steps, n_steps]^dim, so keys are unique int64 values
+        base = 2 * n_steps + 1
+        self._key_weights = base ** np.arange(dim, dtype=np.int64)
+        self._key_offset = n_steps
+
+        # Start from a straight rod along the first axis
+        self.sites = np.zeros((n_steps + 1, dim), dtype=np.int64)
+        self.sites[:, 0] = np.arange(n_steps + 1)
+        self.occupied = dict(zip(self._keys(self.sites).tolist(), range(n_steps + 1)))
+        self.attempts = 0
+        self.accepted = 0
+
+    def _keys(self, points):
+        return (points + self._key_offset) @ self._key_weights
+
+    def pivot(self, first_block=16):
+        """Attempt one pivot move; return True if it was accepted."""
+        n = self.n_steps
+        rng = self.rng
+        i = int(rng.integers(1, n))
+        g = self.symmetries[rng.integers(len(self.symmetries))]
+        pivot = self.sites[i]
+        occupied = self.occupied
+        self.attempts += 1
+
+        # Move the shorter side: the tail (i, n] or the head [0, i), walked outward from i
+        tail = i >= n // 2
+        n_moving = n - i if tail else i
+        new_blocks = []
+        start = 0
+        block = first_block
+        while start < n_moving:
+            stop = min(start + block, n_moving)
+            if tail:
+                old = self.sites[i + 1 + start:i + 1 + stop]
+            else:
+                old = self.sites[i - stop:i - start][::-1]
+            new = (old - pivot) @ g.T + pivot
+            for key in self._keys(new).tolist():
+                j = occupied.get(key)
+                if j is not None and (j <= i if tail else j >= i):
+                    return False
+            new_blocks.append(new)
+            start = stop
+            block *= 2
+
+        new = np.concatenate(new_blocks)
+        if tail:
+            moving = slice(i + 1, n + 1)
+        else:
+            new = new[::-1]
+            moving = slice(0, i)
+        indices = range(moving.start, moving.stop)
+        for key in self._keys(self.sites[moving]).tolist():
+            del occupied[key]
+        occupied.update(zip(self._keys(new).tolist(), indices))
+        self.sites[moving] = new
+        self.accepted += 1
+        return True
+
+    def end_to_end_squared(self):
+        d = self.sites[-1] - self.sites[0]
+        return int(d @ d)
+
+    def is_self_avoiding(self):
+        """Full check, O(n): every site distinct and every step of unit length."""
+        steps = np.abs(np.diff(self.sites, axis=0)).sum(axis=1)
+        return len(set(self._keys(self.sites).tolist())) == self.n_steps + 1 and bool((steps == 1).all())
+
+def integrated_autocorrelation_time(series, c=6.0):
+    """
+    Integrated autocorrelation time of a time series, from the FFT
+    autocorrelation with Sokal's automatic window (smallest W >= c * tau(W)).
+    """
+    x = np.asarray(series, dtype=float) - np.mean(series)
+    n = x.size
+    if n < 2 or not x.any():
+        return 0.5
+    f = np.fft.rfft(x, 2 * n)
+    acf = np.fft.irfft(f * np.conj(f))[:n]
+    acf /= acf[0]
+    tau = 2 * np.cumsum(acf) - 1  # tau(W) = 1 + 2 sum_{t=1}^{W} rho(t)
+    windows = np.arange(n)
+    ok = windows >= c * tau
+    W = np.argmax(ok) if ok.any() else n - 1
+    return max(tau[W] / 2, 0.5)
+
+def sample_end_to_end(n_steps, dim=2, n_attempts=100000, n_equilibrate=None, seed=None):
+    """
+    Runs a pivot chain and returns the end-to-end distance R^2 after every
+    attempt (after equilibration), with acceptance fraction and pivots/s.
+    """
+    walk = PivotWalk(n_steps, dim, seed)
+    if n_equilibrate is None:
+        n_equilibrate = n_attempts // 5
+    for _ in range(n_equilibrate):
+        walk.pivot()
+    series = np.empty(n_attempts)
+    start = time.perf_counter()
+    accepted_before = walk.accepted
+    for t in range(n_attempts):
+        walk.pivot()
+        series[t] = walk.end_to_end_squared()
+    elapsed = time.perf_counter() - start
+    acceptance = (walk.accepted - accepted_before) / n_attempts
+    return series, acceptance, n_attempts / elapsed, walk
+
+def flory_exponent(n_values=(100, 200, 400, 800, 1600, 3200), dim=2, n_attempts=50000, seed=None):
+    """
+    Estimates the Flory exponent nu from <R^2> ~ N^(2 nu).
+    Each <R^2> gets an error bar of sqrt(2 tau var / M), with tau the
+    integrated autocorrelation time of the chain. A weighted log-log fit then
+    gives nu with its error.
+    """
+    print(f"{'N':>8}{'<R^2>':>14}{'± error':>12}{'tau_int':>10}{'Accept':>9}{'Pivots/s':>12}")
+    seeds = np.random.SeedSequence(seed).spawn(len(n_values))
+    means, errors = [], []
+    for n_steps, ss in zip(n_values, seeds):
+        series, acceptance, rate, _ = sample_end_to_end(n_steps, dim, n_attempts, seed=ss)
+        tau = integrated_autocorrelation_time(series)
+        mean = series.mean()
+        error = np.sqrt(2 * tau * series.var() / series.size)
+        means.append(mean)
+        errors.append(error)
+        print(f"{n_steps:>8}{mean:>14.1f}{error:>12.1f}{tau:>10.1f}{acceptance:>9.3f}{rate:>12,.0f}")
+
+    log_n = np.log(n_values)
+    log_r2 = np.log(means)
+    sigma = np.array(errors) / np.array(means)
+    (slope, intercept), cov = np.polyfit(log_n, log_r2, 1, w=1 / sigma, cov='unscaled')
+    nu, nu_err = slope / 2, np.sqrt(cov[0, 0]) / 2
+    exact = {2: 0.75, 3: 0.5876}[dim]
+    print(f"Flory exponent nu = {nu:.4f} ± {nu_err:.4f} (accepted value {exact})")
+    return nu, nu_err, np.array(means), np.array(errors)
+
+def pivot_benchmark(n_values=(10**3, 10**4, 10**5), dim=2, n_attempts=20000, seed=None):
+    """Pivot attempts per second and acceptance fraction against walk length."""
+    print(f"{'N':>10}{'Pivots/s':>14}{'Accepted/s':>14}{'Accept':>9}")
+    rows = []
+    for n_steps in n_values:
+        _, acceptance, rate, walk = sample_end_to_end(n_steps, dim, n_attempts, n_equilibrate=0, seed=seed)
+        assert walk.is_self_avoiding()
+        print(f"{n_steps:>10,}{rate:>14,.0f}{rate * acceptance:>14,.0f}{acceptance:>9.3f}")
+        rows.append((n_steps, rate, acceptance))
+    return rows
+
+def plot_walk(walk):
+    """Draws a 2D walk, or the xy projection of a 3D one."""
+    plt.figure(figsize=(8, 8))
+    plt.plot(walk.sites[:, 0], walk.sites[:, 1], lw=0.5)
+    plt.plot(*walk.sites[0, :2], 'go', markersize=8, label='Start')
+    plt.plot(*walk.sites[-1, :2], 'ro', markersize=8, label='End')
+    plt.title(f'Self-Avoiding Walk ({walk.n_steps:,} steps, {walk.accepted:,} accepted pivots)')
+    plt.xlabel('X Position')
+    plt.ylabel('Y Position')
+    plt.axis('equal')
+    plt.grid(True)
+    plt.legend()
+    plt.show()
+
+if __name__ == "__main__":
+    print("--- Flory Exponent on the Square Lattice ---")
+    flory_exponent(dim=2, seed=1)
+
+    print("\n--- Flory Exponent on the Cubic Lattice ---")
+    flory_exponent(dim=3, seed=2)
+
+    print("\n--- Pivot Throughput ---")
+    pivot_benchmark(dim=2, seed=3)
+
+    _, _, _, walk = sample_end_to_end(100000, dim=2, n_attempts=5000, seed=4)
+    plot_walk(walk)
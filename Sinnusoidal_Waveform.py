@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation 
+import itertools
+from Waveform_Synthesis import waveform_blocks, oscillator_bank_blocks, WAVEFORMS
 x = np.linspace(-2*np.pi, 2*np.pi, 400)
 
 def Plot_Sinusoidal():
@@ -47,13 +49,104 @@ def Animate_Sinusoidal():
     ani = animation.FuncAnimation(fig, Animate, frames=400, blit=True, interval=50, repeat=True)
     plt.show()
     
+class MirroredRingBuffer:
+    """
+    Ring buffer of the last `size` samples, stored twice back to back. The
+    window from the oldest to the newest sample is then always the
+    contiguous slice data[head:head + size]. view() returns it without
+    copying, and memory stays at 2 * size however long the stream runs.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.data = np.zeros(2 * size)
+        self.head = 0  # index of the oldest sample
+        self.total = 0  # samples written so far
+
+    def write(self, samples):
+        self.total += samples.size
+        samples = samples[-self.size:]  # Only the newest `size` samples can be kept
+        n = samples.size
+        first = min(n, self.size - self.head)
+        for offset in (0, self.size):
+            self.data[offset + self.head:offset + self.head + first] = samples[:first]
+            self.data[offset:offset + n - first] = samples[first:]
+        self.head = (self.head + n) % self.size
+
+    def view(self):
+        return self.data[self.head:self.head + self.size]
+
+def block_reader(blocks):
+    """Turns a stream of fixed-size blocks into read(n) calls for any n, keeping leftovers for the next read."""
+    pending = np.empty(0)
+    def read(n):
+        nonlocal pending
+        parts, have = [pending], pending.size
+        while have < n:
+            block = next(blocks)
+            parts.append(block)
+            have += block.size
+        joined = np.concatenate(parts)
+        pending = joined[n:]
+        return joined[:n]
+    return read
+
+def signal_source(waveform='sine', frequency=5.0, sample_rate=1000, block_size=4096):
+    """Block stream for the oscilloscope: sine, beats, or a band-limited square/sawtooth/triangle."""
+    if waveform == 'sine':
+        return oscillator_bank_blocks([frequency], 1.0, sample_rate, block_size)
+    if waveform == 'beats':
+        return oscillator_bank_blocks([frequency, 1.1 * frequency], 0.5, sample_rate, block_size)
+    if waveform in WAVEFORMS:
+        return waveform_blocks(waveform, frequency, sample_rate, block_size=block_size)
+    raise ValueError(f"Unknown waveform {waveform!r}")
+
+def Oscilloscope(blocks, sample_rate=1000, window=2.0, fps=30, speed=1.0, label='signal'):
+    """
+    Scrolling oscilloscope trace of a block stream, running until the window
+    is closed. Each frame reads sample_rate * speed / fps new samples into a
+    mirrored ring buffer holding `window` seconds. The line then shows the
+    buffer's view, so the plot's y data is never copied or regrown. Frames
+    are generated without caching, so memory stays bounded.
+    """
+    n_window = int(window * sample_rate)
+    per_frame = max(1, int(round(sample_rate * speed / fps)))
+    ring = MirroredRingBuffer(n_window)
+    read = block_reader(blocks)
+    ring.write(read(n_window))  # Start with a full screen
+    fig, ax = plt.subplots()
+    line, = ax.plot(np.arange(n_window) / sample_rate, ring.view(), lw=1.5, color='blue', label=label)
+    clock = ax.text(0.02, 0.95, '', transform=ax.transAxes, fontsize=10, bbox=dict(facecolor='white', alpha=0.5))
+    ax.set_xlim(0, window)
+    ax.set_ylim(-1.5, 1.5)
+    ax.set_title("Oscilloscope")
+    ax.set_xlabel("Time in window (s)")
+    ax.set_ylabel("Amplitude")
+    ax.grid()
+    plt.legend(loc='upper right')
+    print(f"Oscilloscope: {per_frame} samples per frame at {fps} fps, {n_window} samples on screen...")
+    def Animate(frame):
+        ring.write(read(per_frame))
+        line.set_ydata(ring.view())
+        if frame % fps == 0:
+            clock.set_text(f"t = {ring.total / sample_rate:.1f} s")
+        return line, clock  # Blitting erases the clock on any frame that does not return it
+    ani = animation.FuncAnimation(fig, Animate, frames=itertools.count(), blit=True, interval=1000 / fps,
+                                  cache_frame_data=False)
+    plt.show()
+    return ani
+
 print("Choose an option: ")
 print("1. Plot of Sinusoidal Waveform")
 print("2. Animation of Sinusoidal waveform")
-n = (int)(input("Enter your option '1' or '2': "))
+print("3. Oscilloscope (streaming sine, beats, square, sawtooth or triangle)")
+n = (int)(input("Enter your option '1', '2' or '3': "))
 if n==1:
     Plot_Sinusoidal()
 elif n==2:
     Animate_Sinusoidal()
+elif n==3:
+    waveform = input("Enter the waveform (sine, beats, square, sawtooth or triangle): ").strip().lower()
+    frequency = (float)(input("Enter the frequency in Hz (e.g. 2): "))
+    Oscilloscope(signal_source(waveform, frequency), label=f'{waveform} {frequency:g} Hz')
 else:
     print("Wrong Choice")
\ No newline at end of file
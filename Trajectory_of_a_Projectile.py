@@ -1,12 +1,17 @@
 #Aim : To calculate the trajectory of a projectile (ball) by repeatedly applying the law of motion per small time steps using for loop
 import numpy as np
 import matplotlib.pyplot as plt
+import time
+from collections import OrderedDict
 
 import os
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 clear_screen()
 
+trajectory_tables = OrderedDict() #height tables of a fan of launch angles per (v0, drag, k, dt), kept across inputs for the targeting solver
+TABLE_CACHE_SIZE = 8 #least recently used tables beyond this many are dropped
+
 while True:
     v0 = (float)(input("Enter the initial velocity of the projectile: ")) #initial velocity in m/s
     g = 9.81 #acceleration due to gravity in m/s^2
@@ -21,6 +26,385 @@ while True:
     H = v0**2*np.sin(theta_rad)**2/(2*g) #maximum height in meters
     R = v0**2 * np.sin(2*theta_rad) / g #range in meters
     param_text = " "
+
+    def projectile_acceleration(vx, vy, drag='none', k=0.0):
+        """
+        Acceleration of each shot: gravity plus drag. Linear drag is a = -k*v
+        (k in 1/s) and quadratic drag is a = -k*|v|*v (k in 1/m).
+        """
+        if drag == 'none':
+            return np.zeros_like(vx), np.full_like(vy, -g)
+        if drag == 'linear':
+            return -k * vx, -g - k * vy
+        if drag == 'quadratic':
+            speed = np.hypot(vx, vy)
+            return -k * speed * vx, -g - k * speed * vy
+        raise ValueError(f"Unknown drag model {drag!r}; use 'none', 'linear' or 'quadratic'")
+
+    def hermite(p0, p1, m0, m1, s):
+        """Cubic Hermite interpolation on one step: values p, slopes m (already scaled by dt), s in [0, 1]."""
+        s2, s3 = s * s, s * s * s
+        return (2*s3 - 3*s2 + 1) * p0 + (s3 - 2*s2 + s) * m0 + (3*s2 - 2*s3) * p1 + (s3 - s2) * m1
+
+    def hermite_slope(p0, p1, m0, m1, s):
+        """Derivative of hermite() with respect to s."""
+        s2 = s * s
+        return (6*s2 - 6*s) * (p0 - p1) + (3*s2 - 4*s + 1) * m0 + (3*s2 - 2*s) * m1
+
+    def hermite_root(p0, p1, m0, m1, level=0.0):
+        """Where the Hermite interpolant crosses level within the step: Newton from the linear crossing."""
+        s = np.clip((level - p0) / (p1 - p0), 0, 1)
+        for _ in range(6):
+            slope = hermite_slope(p0, p1, m0, m1, s)
+            step = (hermite(p0, p1, m0, m1, s) - level) / np.where(slope != 0, slope, np.inf)
+            s = np.clip(s - step, 0, 1)
+        return s
+
+    def simulate_launches(v0, theta_deg, drag='none', k=0.0, dt=0.01, y0=0.0, max_time=None,
+                          record_paths=False, x_stop=None):
+        """
+        Integrates every (v0, theta) launch at once with RK4 on a (4, n) state
+        of x, y, vx, vy rows. v0 and theta_deg broadcast against each other.
+        In a step where y crosses 0, the impact time is the root of the
+        cubic Hermite interpolant of y, found by Newton's method. Shots that
+        have landed are removed from the active set, so later steps only cost
+        the shots still in the air. The apex comes from the sign change of vy.
+        y0 is the launch height and must be at or above the ground (y = 0).
+        Returns a dict of per-launch arrays: range, apex, apex_x, t_flight,
+        impact_speed and impact_angle (deg). Shots still flying at max_time
+        get NaN. With record_paths it also returns 'paths': positions after
+        every step, shape (steps, n, 2), NaN once a shot has been retired.
+
+        x_stop (broadcast against v0) adds a second event: shots are retired
+        when x reaches x_stop instead of at the ground, and the result
+        gains y_at_x and t_at_x. Shots keep flying below the ground until
+        then, so y_at_x is a smooth function of the launch angle for the
+        targeting solver.
+        """
+        if y0 < 0:
+            raise ValueError("Launch height y0 must be at or above the ground")
+        v0, theta_deg = np.broadcast_arrays(np.asarray(v0, dtype=float), np.asarray(theta_deg, dtype=float))
+        shape = v0.shape
+        theta_rad = np.radians(theta_deg.ravel())
+        n = theta_rad.size
+        vx0 = v0.ravel() * np.cos(theta_rad)
+        vy0 = v0.ravel() * np.sin(theta_rad)
+        if max_time is None:
+            # Twice the drag-free flight time of the highest shot, which bounds all drag models used here
+            max_time = 2 * np.nanmax(np.r_[(vy0 + np.sqrt(np.maximum(vy0, 0)**2 + 2 * g * max(y0, 0))) / g, 0]) + 1
+            if x_stop is not None:
+                max_time *= 10
+        if x_stop is not None:
+            x_stop = np.broadcast_to(np.asarray(x_stop, dtype=float), shape).ravel()
+
+        state = np.stack([np.zeros(n), np.full(n, float(y0)), vx0, vy0])
+        active = np.arange(n)
+        result = {key: np.full(n, np.nan) for key in ('range', 't_flight', 'impact_speed', 'impact_angle')}
+        result['apex'] = np.full(n, float(y0))
+        result['apex_x'] = np.zeros(n)
+        if x_stop is not None:
+            result['y_at_x'] = np.full(n, np.nan)
+            result['t_at_x'] = np.full(n, np.nan)
+        paths = [state[:2].T.copy()] if record_paths else None
+
+        def rhs(S):
+            out = np.empty_like(S)
+            out[:2] = S[2:]
+            out[2], out[3] = projectile_acceleration(S[2], S[3], drag, k)
+            return out
+
+        t = 0.0
+        while active.size and t < max_time:
+            k1 = rhs(state)
+            k2 = rhs(state + 0.5 * dt * k1)
+            k3 = rhs(state + 0.5 * dt * k2)
+            k4 = rhs(state + dt * k3)
+            new = state + dt / 6 * (k1 + 2*k2 + 2*k3 + k4)
+            d_old, d_new = k1, rhs(new)
+
+            # Apex: vy changes sign during the step
+            peak = (state[3] > 0) & (new[3] <= 0)
+            if peak.any():
+                s = state[3, peak] / (state[3, peak] - new[3, peak])
+                idx = active[peak]
+                result['apex'][idx] = hermite(state[1, peak], new[1, peak], dt * d_old[1, peak], dt * d_new[1, peak], s)
+                result['apex_x'][idx] = hermite(state[0, peak], new[0, peak], dt * d_old[0, peak], dt * d_new[0, peak], s)
+
+            # Ground impact: Newton on the Hermite interpolant of y, from the linear crossing
+            landed = (state[1] >= 0) & (new[1] < 0)
+            if landed.any():
+                a, b = state[:, landed], new[:, landed]
+                da, db = dt * d_old[:, landed], dt * d_new[:, landed]
+                s = hermite_root(a[1], b[1], da[1], db[1])
+                vx_hit = a[2] + s * (b[2] - a[2])
+                vy_hit = a[3] + s * (b[3] - a[3])
+                idx = active[landed]
+                result['range'][idx] = hermite(a[0], b[0], da[0], db[0], s)
+                result['t_flight'][idx] = t + s * dt
+                result['impact_speed'][idx] = np.hypot(vx_hit, vy_hit)
+                result['impact_angle'][idx] = np.degrees(np.arctan2(-vy_hit, vx_hit))
+            retire = landed
+            if x_stop is not None:
+                x_target = x_stop[active]
+                retire = (state[0] < x_target) & (new[0] >= x_target)
+                if retire.any():
+                    a, b = state[:, retire], new[:, retire]
+                    da, db = dt * d_old[:, retire], dt * d_new[:, retire]
+                    s = hermite_root(a[0], b[0], da[0], db[0], x_target[retire])
+                    idx = active[retire]
+                    result['y_at_x'][idx] = hermite(a[1], b[1], da[1], db[1], s)
+                    result['t_at_x'][idx] = t + s * dt
+            if retire.any():
+                keep = ~retire
+                new, active = new[:, keep], active[keep]
+            state = new
+            t += dt
+            if record_paths:
+                frame = np.full((n, 2), np.nan)
+                frame[active] = state[:2].T
+                paths.append(frame)
+
+        out = {key: value.reshape(shape) for key, value in result.items()}
+        if record_paths:
+            out['paths'] = np.array(paths).reshape((len(paths),) + shape + (2,))
+        return out
+
+    def LaunchSweep(v0, drag, k, n_angles=8000):
+        """Sweeps n_angles launch angles for each drag model in one call per model and plots range and apex."""
+        angles = np.linspace(0.5, 89.5, n_angles)
+        fig, ax = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
+        for model, kk in dict.fromkeys([('none', 0.0), (drag, k)]):
+            start = time.perf_counter()
+            res = simulate_launches(v0, angles, model, kk)
+            elapsed = time.perf_counter() - start
+            best = np.nanargmax(res['range'])
+            label = 'No drag' if model == 'none' else f'{model.capitalize()} drag (k = {kk})'
+            print(f"{label:<30}: {n_angles} launches in {elapsed:.2f} s, "
+                  f"max range {res['range'][best]:.2f} m at {angles[best]:.2f}°")
+            ax[0].plot(angles, res['range'], label=label)
+            ax[1].plot(angles, res['apex'], label=label)
+        for a, ylabel in zip(ax, ('Range (m)', 'Max Height (m)')):
+            a.set_xlabel('Launch angle (°)')
+            a.set_ylabel(ylabel)
+            a.grid()
+            a.legend()
+        plt.suptitle(f"Launch Sweep, $v_0$ = {v0} m/s", fontsize=14)
+
+        # A handful of trajectories, recorded in one batched call
+        show = np.array([15, 30, 45, 60, 75], dtype=float)
+        res = simulate_launches(v0, show, drag, k, record_paths=True)
+        plt.figure(constrained_layout=True)
+        for j, angle in enumerate(show):
+            plt.plot(res['paths'][:, j, 0], res['paths'][:, j, 1], label=f'θ = {angle:.0f}°')
+        plt.title(f"Trajectories with {drag} drag")
+        plt.xlabel("Horizontal Distance (m)")
+        plt.ylabel("Vertical Distance (m)")
+        plt.ylim(bottom=0)
+        plt.grid()
+        plt.legend(loc="best")
+        plt.show()
+
+    def trajectory_table(v0, drag='none', k=0.0, dt=0.01, n_points=1025):
+        """
+        Range-versus-angle table for one (v0, drag, k, dt): a fan of launches
+        from -10° to 90° in 0.25° steps. Besides the range it stores each
+        shot's height at n_points evenly spaced fractions u = x / range of its
+        own range, so steep and flat shots are resolved equally well. Also
+        stores an estimate of the error of linear interpolation in that table.
+        The tables are kept in trajectory_tables, least recently used first,
+        and at most TABLE_CACHE_SIZE of them are kept.
+        Returns (angles, ranges, heights, error).
+        """
+        key = (float(v0), drag, float(k), float(dt))
+        if key in trajectory_tables:
+            trajectory_tables.move_to_end(key)
+            return trajectory_tables[key]
+        angles = np.arange(-10, 90.25, 0.25)
+        res = simulate_launches(v0, angles, drag, k, dt, record_paths=True)
+        ranges, paths = res['range'], res['paths']
+        u = np.linspace(0, 1, n_points)
+        heights = np.empty((angles.size, n_points))
+        for i in range(angles.size):
+            ok = ~np.isnan(paths[:, i, 0])
+            # The recorded points stop before impact; close the path at the landing point
+            px = np.r_[paths[ok, i, 0], ranges[i]]
+            py = np.r_[paths[ok, i, 1], 0.0]
+            heights[i] = np.interp(u * ranges[i], px, py)
+        error = max(g * dt**2, np.max(np.abs(np.diff(heights, 2, axis=1))) / 4)
+        trajectory_tables[key] = (angles, ranges, heights, error)
+        while len(trajectory_tables) > TABLE_CACHE_SIZE:
+            trajectory_tables.popitem(last=False)
+        return trajectory_tables[key]
+
+    def table_heights(table, x):
+        """
+        Height of every tabulated launch at every target distance x, by linear
+        interpolation in the table. Past its landing point a shot is continued
+        along a 45° line into the ground, so a shot that falls short still gets
+        a finite miss that grows with the shortfall. Targets behind the
+        launcher get -inf.
+        """
+        angles, ranges, heights, error = table
+        n_points = heights.shape[1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Shots at or below the horizon land at once: range 0, so every target is beyond them
+            position = x[None, :] / ranges[:, None] * (n_points - 1)
+            j = np.clip(np.nan_to_num(position, posinf=0), 0, n_points - 2).astype(np.intp)
+            rows = np.arange(angles.size)[:, None]
+            inside = heights[rows, j] + (position - j) * (heights[rows, j + 1] - heights[rows, j])
+        beyond = ranges[:, None] - x[None, :]
+        return np.where(x[None, :] < 0, -np.inf, np.where(position <= n_points - 1, inside, beyond))
+
+    def shoot_angles(v0, x, y, a, b, drag, k, dt=0.01, tol=1e-6, max_iter=30, fa=None, fb=None, slack=None):
+        """
+        Refines launch angles bracketed by [a, b] (degrees) so that each shot
+        passes through its target (x, y). Each step is a secant step through
+        the last two shots. When that step leaves the bracket or stalls, it
+        falls back to the Illinois (modified regula falsi) point or to
+        bisection. Each iteration is one batched simulate_launches call, with
+        x_stop at the targets, over the targets not yet converged. Converges
+        when the height miss is below tol (m).
+
+        fa and fb are the misses at the bracket ends, e.g. read from a
+        trajectory table, which saves two simulations. slack bounds their
+        error (default g*dt², the error of interpolating between recorded
+        points). Ends closer to zero than slack are therefore re-simulated,
+        and a root that turns out to lie just outside its bracket is
+        recovered by widening it.
+        Returns NaN where no root is bracketed or the iteration fails.
+        """
+        def miss(theta, idx):
+            y_at_x = simulate_launches(v0, theta, drag, k, dt, x_stop=x[idx])['y_at_x']
+            return np.where(np.isnan(y_at_x), -np.inf, y_at_x - y[idx])  # Never reaching x counts as passing below
+
+        slack = g * dt**2 if slack is None else slack
+        a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+        fa = np.full(x.size, np.nan) if fa is None else np.array(fa, dtype=float)
+        fb = np.full(x.size, np.nan) if fb is None else np.array(fb, dtype=float)
+        for theta_end, f_end in ((a, fa), (b, fb)):
+            unsure = np.flatnonzero(~(np.abs(f_end) >= slack))
+            if unsure.size:
+                f_end[unsure] = miss(theta_end[unsure], unsure)
+        slipped = np.flatnonzero((fa * fb > 0) & (np.minimum(np.abs(fa), np.abs(fb)) < slack))
+        if slipped.size:
+            # The root sits just beyond the end nearer to zero: make that end the far side of a new bracket
+            near_a = np.abs(fa[slipped]) < np.abs(fb[slipped])
+            near, far = np.where(near_a, a[slipped], b[slipped]), np.where(near_a, b[slipped], a[slipped])
+            f_near = np.where(near_a, fa[slipped], fb[slipped])
+            a[slipped], fa[slipped] = near, f_near
+            b[slipped] = near + 0.05 * (near - far)
+            fb[slipped] = miss(b[slipped], slipped)
+
+        theta = np.full(x.size, np.nan)
+        theta[np.abs(fa) <= tol] = a[np.abs(fa) <= tol]
+        theta[np.abs(fb) <= tol] = b[np.abs(fb) <= tol]
+        active = np.flatnonzero((fa * fb < 0) & np.isnan(theta))
+        last, f_last = a.copy(), fa.copy()  # Shot before the latest, for the secant step
+        for _ in range(max_iter):
+            if not active.size:
+                break
+            aa, bb, faa, fbb = a[active], b[active], fa[active], fb[active]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = bb - fbb * (bb - last[active]) / (fbb - f_last[active])
+                outside = ~((c - aa) * (c - bb) < 0)
+                c[outside] = (bb - fbb * (bb - aa) / (fbb - faa))[outside]
+            stalled = ~((c - aa) * (c - bb) < 0)
+            c[stalled] = 0.5 * (aa + bb)[stalled]
+            fc = miss(c, active)
+            last[active], f_last[active] = bb, fbb
+            flip = fc * fbb < 0
+            a[active] = np.where(flip, bb, aa)
+            fa[active] = np.where(flip, fbb, 0.5 * faa)
+            b[active], fb[active] = c, fc
+            done = np.abs(fc) <= tol
+            theta[active[done]] = c[done]
+            active = active[~done]
+        return theta
+
+    def target_angles(v0, x, y, drag='none', k=0.0, dt=0.01, tol=1e-6):
+        """
+        Low and high launch angles (degrees) that hit each target (x, y)
+        from the origin at speed v0. x and y broadcast, and targets are at or
+        above the ground. Without drag this is the closed form
+        tan θ = (v0² ∓ sqrt(v0⁴ - g(g x² + 2 y v0²))) / (g x).
+        With drag, the cached trajectory table brackets each root: the first
+        rising and last falling sign change of height minus y. shoot_angles
+        then refines all low and high brackets in one batch. Unreachable
+        targets get NaN.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+        if drag == 'none' or k == 0:
+            disc = v0**4 - g * (g * x**2 + 2 * y * v0**2)
+            root = np.sqrt(np.where(disc >= 0, disc, np.nan))
+            low = np.degrees(np.arctan2(v0**2 - root, g * x))
+            high = np.degrees(np.arctan2(v0**2 + root, g * x))
+            return low.reshape(shape), high.reshape(shape)
+
+        table = trajectory_table(v0, drag, k, dt)
+        angles, error = table[0], table[3]
+        miss = table_heights(table, x) - y
+        rising = (miss[:-1] < 0) & (miss[1:] >= 0)
+        falling = (miss[:-1] >= 0) & (miss[1:] < 0)
+        has_low, has_high = rising.any(axis=0), falling.any(axis=0)
+        i_low = np.argmax(rising, axis=0)[has_low]
+        i_high = (falling.shape[0] - 1 - np.argmax(falling[::-1], axis=0))[has_high]
+
+        # Low and high roots of all targets are refined together
+        which = np.r_[np.flatnonzero(has_low), np.flatnonzero(has_high)]
+        i = np.r_[i_low, i_high]
+        fa, fb = miss[i, which], miss[i + 1, which]
+        roots = shoot_angles(v0, x[which], y[which], angles[i], angles[i + 1], drag, k, dt, tol, fa=fa, fb=fb,
+                             slack=error)
+        low, high = np.full(x.size, np.nan), np.full(x.size, np.nan)
+        low[has_low] = roots[:i_low.size]
+        high[has_high] = roots[i_low.size:]
+        return low.reshape(shape), high.reshape(shape)
+
+    def Targeting(v0, drag, k, n_targets=2000, seed=0):
+        """Solves random targets with and without drag, checks the hits by forward simulation and plots them."""
+        rng = np.random.default_rng(seed)
+        reach = simulate_launches(v0, np.linspace(1, 89, 89), drag, k)
+        x = rng.uniform(0.05, 0.95, n_targets) * np.nanmax(reach['range'])
+        y = rng.uniform(0, 0.6, n_targets) * np.nanmax(reach['apex'])
+        for model, kk in dict.fromkeys([('none', 0.0), (drag, k)]):
+            for attempt in ('cold', 'warm'):
+                start = time.perf_counter()
+                low, high = target_angles(v0, x, y, model, kk)
+                elapsed = time.perf_counter() - start
+                if model == 'none' or kk == 0:
+                    break
+                print(f"{model} drag, {attempt} table: {elapsed:.2f} s")
+            hit = ~np.isnan(low)
+            both = np.r_[low, high]
+            solved = ~np.isnan(both)
+            check = simulate_launches(v0, both[solved], model, kk, x_stop=np.r_[x, x][solved])
+            worst = np.max(np.abs(check['y_at_x'] - np.r_[y, y][solved]), initial=0)
+            print(f"{'No drag' if model == 'none' else model.capitalize() + ' drag'}: {n_targets} targets in "
+                  f"{elapsed:.3f} s, {hit.sum()} reachable, worst height miss {worst:.2e} m")
+
+        fig, ax = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
+        sc = ax[0].scatter(x, y, c=low, s=6, cmap='viridis')
+        ax[0].scatter(x[~hit], y[~hit], s=6, c='lightgray', label='Out of reach')
+        fig.colorbar(sc, ax=ax[0], label='Low launch angle (°)')
+        ax[0].set_title(f"Targets ({drag} drag, k = {k})")
+        ax[0].legend()
+        show = np.flatnonzero(hit)[:3]
+        res = simulate_launches(v0, np.r_[low[show], high[show]], drag, k, record_paths=True)
+        for j in range(2 * show.size):
+            ax[1].plot(res['paths'][:, j, 0], res['paths'][:, j, 1], '-' if j < show.size else '--')
+        ax[1].plot(x[show], y[show], 'rx', markersize=10, label='Targets')
+        ax[1].set_title("Low (solid) and high (dashed) solutions")
+        ax[1].set_ylim(bottom=0)
+        ax[1].legend()
+        for a in ax:
+            a.set_xlabel("Horizontal Distance (m)")
+            a.set_ylabel("Vertical Distance (m)")
+            a.grid()
+        plt.suptitle(f"Inverse Targeting, $v_0$ = {v0} m/s", fontsize=14)
+        plt.show()
+
     def PLotTrajectory():
         print("Calculating trajectory...")
         x = np.zeros(N_steps) #initialize x position array
@@ -42,12 +426,34 @@ while True:
         plt.text(0.05*max(x), 0.95*max(y), param_text, fontsize=10, bbox=dict(facecolor='white', alpha=0.2))
         plt.show()
         
-    def AnimateTrajectory():    
-        t_array = np.linspace(t0, T, N_steps) #time array
-        x = np.zeros(N_steps) #initialize x position array
-        y = np.zeros(N_steps) #initialize y position array
-        i=0
-        v_y = vy #initial vertical velocity
+    def playback_times(t_start, t_end, fps=30, speed=1.0):
+        """
+        Simulation time shown in each animation frame, for playback at fps
+        frames per second and speed simulated seconds per wall-clock second.
+        The frame count depends only on the flight time, not on the solver
+        step dt.
+        """
+        n_frames = int(np.ceil((t_end - t_start) / speed * fps)) + 1
+        return np.linspace(t_start, t_end, n_frames)
+
+    def AnimateTrajectory(fps=30, speed=1.0, text_every=0.1):
+        """
+        Plays the flight in real time (speed = 1) at fps frames per second.
+        The trajectory is computed once on the solver grid t0, t0 + dt, ...,
+        and each frame interpolates the projectile position at its own
+        playback time. The readout text is updated only every text_every
+        seconds of wall-clock time, which saves formatting and laying out the
+        string every frame. Every frame still returns the text, because
+        blitting erases any animated artist that a frame does not return.
+        """
+        t_array = np.linspace(t0, T, N_steps + 1) #solver grid, step ≈ dt
+        x = vx * t_array #x position on the solver grid
+        y = vy * t_array - 0.5 * g * t_array**2 #y position on the solver grid
+        t_frames = playback_times(t0, T, fps, speed)
+        x_frames = np.interp(t_frames, t_array, x) #interpolated positions at the playback times
+        y_frames = np.interp(t_frames, t_array, y)
+        grid_index = np.searchsorted(t_array, t_frames, side='right') #solver points already passed in each frame
+        text_stride = max(1, int(round(text_every * fps)))
         import matplotlib.animation as animation
         fig, ax = plt.subplots(constrained_layout=True)
         point, = ax.plot([], [], 'ro', markersize=6)  # projectile point
@@ -59,36 +465,41 @@ while True:
         ax.set_xlabel("Horizontal Distance (m)")
         ax.set_ylabel("Vertical Distance (m)")
         ax.grid()
-        print("Animating trajectory...")
+        print(f"Animating trajectory: {t_frames.size} frames at {fps} fps for {N_steps} solver steps...")
         def Animate(frame):
-            nonlocal i,x,y, v_y
-            global t, dt, vx, vy, g, param_text
-            param_text = " "
-            i=frame
-            if i < N_steps:
-                t = t_array[i] #current time
-                x[i] = vx * t #update x position
-                y[i] = vy * t - 0.5 * g * t**2 #update y position
-                v_y = v_y - g * dt  # update vertical velocity
-                line.set_data(x[:i], y[:i])
-                # Update the text dynamically
-                point.set_data([x[i]], [y[i]])  # update projectile position
-                text.set_text(f"t = {t:.2f} s\n"f"x = {x[i]:.2f} m\n"f"y = {y[i]:.2f} m\n"f"$v_x$ = {vx} m/s\n"f"$v_y$ = {v_y}\n"f"θ = {np.degrees(np.arctan(v_y/vx))}°")
+            n = grid_index[frame]
+            line.set_data(np.r_[x[:n], x_frames[frame]], np.r_[y[:n], y_frames[frame]])
+            point.set_data([x_frames[frame]], [y_frames[frame]])  # update projectile position
+            if frame % text_stride == 0 or frame == t_frames.size - 1:
+                t = t_frames[frame]
+                v_y = vy - g * t
+                text.set_text(f"t = {t:.2f} s\n"f"x = {x_frames[frame]:.2f} m\n"f"y = {y_frames[frame]:.2f} m\n"
+                              f"$v_x$ = {vx:.2f} m/s\n"f"$v_y$ = {v_y:.2f} m/s\n"f"θ = {np.degrees(np.arctan2(v_y, vx)):.2f}°")
             return line, text, point,
         param_text = f"$v_0$ = {v0} m/s\n$\\theta_0$ = {theta}°\nRange ≈ {R:.2f} m\nMax Height ≈ {H:.2f} m\nTime of Flight ≈ {T:.2f} s"
         plt.text(0.85*R, 0.95*H, param_text, fontsize=12, bbox=dict(facecolor='white', alpha=0.2))
-        ani = animation.FuncAnimation(fig, Animate, frames=N_steps, blit=True, interval=50, repeat=False)
+        ani = animation.FuncAnimation(fig, Animate, frames=t_frames.size, blit=True, interval=1000 / fps, repeat=False)
         plt.legend(['Trajectory'])
         plt.show()
         
     print("Choose an option:")
     print("1. Plot Trajectory")
     print("2. Animate Trajectory")
-    choice = input("Enter your choice (1 or 2): ")
+    print("3. Launch Sweep with Drag (thousands of angles at once)")
+    print("4. Targeting: launch angles for many targets")
+    choice = input("Enter your choice (1, 2, 3 or 4): ")
     if choice == '1':
         PLotTrajectory()
     elif choice == '2':
         AnimateTrajectory()
+    elif choice == '3':
+        drag = input("Enter the drag model (none, linear or quadratic): ").strip().lower()
+        k = (float)(input("Enter the drag coefficient k: ")) #1/s for linear drag, 1/m for quadratic drag
+        LaunchSweep(v0, drag, k)
+    elif choice == '4':
+        drag = input("Enter the drag model (none, linear or quadratic): ").strip().lower()
+        k = (float)(input("Enter the drag coefficient k: ")) #1/s for linear drag, 1/m for quadratic drag
+        Targeting(v0, drag, k)
     else:
         print("Invalid choice")
     n = (int)(input("Enter '1' for next input and '0' to break the operation: "))
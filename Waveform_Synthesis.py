@@ -0,0 +1,217 @@
+# Aim: To synthesize periodic signals (Fourier series, square, sawtooth and triangle waves, beats and standing waves) at audio rates, in blocks, using inverse FFT tables and recurrence oscillators
+import numpy as np
+import matplotlib.pyplot as plt
+import time
+
+# Harmonic coefficients: c[h] is the complex amplitude of harmonic h, so that
+# x(t) = Re(sum_h c[h] exp(i h w t)) = sum_h a_h cos(h w t) + b_h sin(h w t) with c[h] = a_h - i b_h
+
+def square_coefficients(n_harmonics):
+    """Square wave of amplitude 1: b_h = 4 / (pi h) for odd h."""
+    h = np.arange(n_harmonics + 1)
+    c = np.zeros(n_harmonics + 1, dtype=complex)
+    odd = h % 2 == 1
+    c[odd] = -1j * 4 / (np.pi * h[odd])
+    return c
+
+def sawtooth_coefficients(n_harmonics):
+    """Rising sawtooth from -1 to 1: b_h = 2 (-1)^(h+1) / (pi h)."""
+    h = np.arange(1, n_harmonics + 1)
+    c = np.zeros(n_harmonics + 1, dtype=complex)
+    c[1:] = -1j * 2 * (-1.0)**(h + 1) / (np.pi * h)
+    return c
+
+def triangle_coefficients(n_harmonics):
+    """Triangle wave of amplitude 1: b_h = 8 (-1)^((h-1)/2) / (pi h)^2 for odd h."""
+    h = np.arange(n_harmonics + 1)
+    c = np.zeros(n_harmonics + 1, dtype=complex)
+    odd = h % 2 == 1
+    c[odd] = -1j * 8 * (-1.0)**((h[odd] - 1) // 2) / (np.pi * h[odd])**2
+    return c
+
+WAVEFORMS = {'square': square_coefficients,
+             'sawtooth': sawtooth_coefficients,
+             'triangle': triangle_coefficients}
+
+def harmonic_table(coefficients, table_size=None):
+    """
+    One period of the Fourier series, sampled at table_size points by a single
+    inverse real FFT. Costs O(N log N) instead of O(N * harmonics) for a direct
+    sum. table_size defaults to a power of two at least 32 times the highest
+    harmonic, which keeps linear interpolation in the wavetable accurate.
+    """
+    coefficients = np.asarray(coefficients, dtype=complex)
+    n_harmonics = coefficients.size - 1
+    if table_size is None:
+        table_size = max(4096, 1 << int(np.ceil(np.log2(32 * max(n_harmonics, 1)))))
+    if table_size < 2 * n_harmonics + 1:
+        raise ValueError(f"table_size {table_size} cannot hold {n_harmonics} harmonics without aliasing")
+    spectrum = np.zeros(table_size // 2 + 1, dtype=complex)
+    spectrum[:n_harmonics + 1] = coefficients * (table_size / 2)
+    spectrum[0] = coefficients[0].real * table_size
+    return np.fft.irfft(spectrum, n=table_size)
+
+def fourier_series(coefficients, t, frequency=1.0):
+    """Direct sum of the series at times t, O(len(t) * harmonics); the reference for the faster engines."""
+    h = np.arange(len(coefficients))
+    return (np.exp(1j * 2 * np.pi * frequency * np.outer(t, h)) @ np.asarray(coefficients)).real
+
+def wavetable_oscillator(table, frequency, sample_rate, n_samples, phase=0.0):
+    """
+    Reads a one-period table with a phase accumulator (phase in cycles,
+    [0, 1)) and linear interpolation. frequency may be a scalar or one value
+    per sample (for glides and FM). Returns the samples and the phase after
+    the last one, to pass into the next call for a seamless continuation.
+    """
+    increment = np.broadcast_to(np.asarray(frequency, dtype=float) / sample_rate, (n_samples,))
+    phases = phase + np.concatenate(([0.0], np.cumsum(increment)))
+    phases %= 1.0
+    position = phases[:-1] * table.size
+    index = position.astype(np.int64)
+    frac = position - index
+    samples = table[index] + frac * (table[(index + 1) % table.size] - table[index])
+    return samples, phases[-1]
+
+def wavetable_blocks(table, frequency, sample_rate, block_size=4096, n_blocks=None, phase=0.0):
+    """Yields wavetable blocks forever (or n_blocks of them), carrying the phase across blocks."""
+    produced = 0
+    while n_blocks is None or produced < n_blocks:
+        block, phase = wavetable_oscillator(table, frequency, sample_rate, block_size, phase)
+        produced += 1
+        yield block
+
+def oscillator_bank_blocks(frequencies, amplitudes, sample_rate, block_size=4096, n_blocks=None, phases=None):
+    """
+    Sum of many sinusoids a_k sin(2 pi f_k t + phi_k), generated by the rotation
+    recurrence z_k <- z_k * exp(i w_k). Within a block the recurrence is
+    unrolled into a (block_size, K) table of rotations exp(i w_k n), built
+    once, so each block is a single matrix-vector product. Between blocks the
+    state advances by exp(i w_k block_size) and is renormalized to |z_k| = a_k,
+    so the phase stays continuous and rounding cannot build up.
+    """
+    frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+    amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=float), frequencies.shape)
+    omega = 2 * np.pi * frequencies / sample_rate
+    phases = np.zeros(frequencies.size) if phases is None else np.broadcast_to(phases, frequencies.shape)
+    state = amplitudes * np.exp(1j * np.asarray(phases, dtype=float))
+    rotations = np.exp(1j * np.outer(np.arange(block_size), omega))
+    step = np.exp(1j * omega * block_size)
+    produced = 0
+    while n_blocks is None or produced < n_blocks:
+        yield (rotations @ state).imag
+        state = state * step
+        state *= np.where(amplitudes != 0, amplitudes / np.maximum(np.abs(state), 1e-300), 0)
+        produced += 1
+
+def waveform_blocks(shape='square', frequency=440.0, sample_rate=44100, n_harmonics=None, block_size=4096,
+                    n_blocks=None):
+    """
+    Band-limited square/sawtooth/triangle stream. By default it keeps every
+    harmonic below the Nyquist frequency, so the waveform does not alias.
+    """
+    if n_harmonics is None:
+        n_harmonics = max(1, int((sample_rate / 2) // frequency))
+    table = harmonic_table(WAVEFORMS[shape](n_harmonics))
+    return wavetable_blocks(table, frequency, sample_rate, block_size, n_blocks)
+
+def beats(f1, f2, sample_rate, n_samples, amplitude=1.0):
+    """Two equal tones; the envelope 2 cos(pi (f1 - f2) t) beats at |f1 - f2| Hz."""
+    block = next(oscillator_bank_blocks([f1, f2], amplitude, sample_rate, n_samples, n_blocks=1))
+    t = np.arange(n_samples) / sample_rate
+    envelope = 2 * amplitude * np.abs(np.cos(np.pi * (f1 - f2) * t))
+    return t, block, envelope
+
+def standing_wave(x, t, wavelength=1.0, frequency=1.0, amplitude=1.0):
+    """
+    Sum of two counter-propagating waves, A sin(kx - wt) + A sin(kx + wt),
+    evaluated as the separable product 2A sin(kx) cos(wt) by an outer
+    product. Returns an array of shape (len(t), len(x)).
+    """
+    k = 2 * np.pi / wavelength
+    omega = 2 * np.pi * frequency
+    return 2 * amplitude * np.outer(np.cos(omega * np.asarray(t)), np.sin(k * np.asarray(x)))
+
+def collect(blocks, n_samples):
+    """Concatenates blocks from a stream until n_samples are gathered."""
+    out = np.empty(n_samples)
+    filled = 0
+    for block in blocks:
+        take = min(block.size, n_samples - filled)
+        out[filled:filled + take] = block[:take]
+        filled += take
+        if filled == n_samples:
+            break
+    return out
+
+def synthesis_benchmark(n_samples=10**7, sample_rate=44100, frequency=110.0, block_size=2**15):
+    """Throughput of each engine and its error against the direct Fourier sum."""
+    print(f"{'Engine':<42}{'Samples/s':>14}{'Max error':>12}")
+    n_check = 2000
+    t_check = np.arange(n_check) / sample_rate
+    n_harmonics = int((sample_rate / 2) // frequency)
+    coefficients = square_coefficients(n_harmonics)
+    reference = fourier_series(coefficients, t_check, frequency)
+
+    start = time.perf_counter()
+    table = harmonic_table(coefficients)
+    stream = collect(wavetable_blocks(table, frequency, sample_rate, block_size), n_samples)
+    rate = n_samples / (time.perf_counter() - start)
+    error = np.max(np.abs(stream[:n_check] - reference))
+    print(f"{f'Wavetable, square ({n_harmonics} harmonics)':<42}{rate:>14,.0f}{error:>12.2e}")
+
+    n_bank = 64
+    bank_rate_samples = min(n_samples, 2 * 10**6)
+    start = time.perf_counter()
+    bank = collect(oscillator_bank_blocks(frequency * np.arange(1, 2 * n_bank, 2), 4 / (np.pi * np.arange(1, 2 * n_bank, 2)),
+                                          sample_rate, block_size), bank_rate_samples)
+    rate = bank_rate_samples / (time.perf_counter() - start)
+    error = np.max(np.abs(bank[:n_check] - fourier_series(square_coefficients(2 * n_bank - 1), t_check, frequency)))
+    print(f"{f'Oscillator bank ({n_bank} partials)':<42}{rate:>14,.0f}{error:>12.2e}")
+
+    # Block streaming must agree with one long call: phase continuity across blocks
+    one_shot, _ = wavetable_oscillator(table, frequency, sample_rate, 10 * 1000 + 7)
+    blocked = collect(wavetable_blocks(table, frequency, sample_rate, 1000), 10 * 1000 + 7)
+    bank_long = next(oscillator_bank_blocks([frequency, 3 * frequency], 1.0, sample_rate, 10**4, n_blocks=1))
+    bank_blocked = collect(oscillator_bank_blocks([frequency, 3 * frequency], 1.0, sample_rate, 1000), 10**4)
+    print(f"Block continuity: wavetable {np.max(np.abs(one_shot - blocked)):.1e}, "
+          f"oscillator bank {np.max(np.abs(bank_long - bank_blocked)):.1e}")
+
+def plot_waveforms(frequency=2.0, sample_rate=2000, n_harmonics=50):
+    """The three classic waveforms, beats and a standing wave."""
+    fig, ax = plt.subplots(2, 2, figsize=(14, 9), constrained_layout=True)
+    t = np.arange(sample_rate) / sample_rate
+    for shape in WAVEFORMS:
+        block = collect(waveform_blocks(shape, frequency, sample_rate, n_harmonics, block_size=256), t.size)
+        ax[0, 0].plot(t, block, label=shape.capitalize())
+    ax[0, 0].set_title(f"Band-limited waveforms ({n_harmonics} harmonics)")
+    ax[0, 0].set_xlabel("Time (s)")
+    ax[0, 0].legend()
+
+    h = np.arange(1, 40)
+    ax[0, 1].stem(h, np.abs(square_coefficients(39))[1:], linefmt='C0-', markerfmt='C0o', basefmt=' ', label='Square')
+    ax[0, 1].stem(h + 0.3, np.abs(sawtooth_coefficients(39))[1:], linefmt='C1-', markerfmt='C1o', basefmt=' ', label='Sawtooth')
+    ax[0, 1].stem(h + 0.6, np.abs(triangle_coefficients(39))[1:], linefmt='C2-', markerfmt='C2o', basefmt=' ', label='Triangle')
+    ax[0, 1].set_yscale('log')
+    ax[0, 1].set_title("Harmonic amplitudes")
+    ax[0, 1].set_xlabel("Harmonic")
+    ax[0, 1].legend()
+
+    t, signal, envelope = beats(440.0, 444.0, 44100, 44100)
+    ax[1, 0].plot(t, signal, lw=0.3)
+    ax[1, 0].plot(t, envelope, 'r--', t, -envelope, 'r--')
+    ax[1, 0].set_title("Beats: 440 Hz + 444 Hz")
+    ax[1, 0].set_xlabel("Time (s)")
+
+    x = np.linspace(0, 2, 400)
+    snapshots = standing_wave(x, np.linspace(0, 0.5, 6))
+    for snapshot in snapshots:
+        ax[1, 1].plot(x, snapshot)
+    ax[1, 1].set_title("Standing wave at successive times")
+    ax[1, 1].set_xlabel("Position (x)")
+    for a in ax.flat:
+        a.grid(True)
+    plt.show()
+
+if __name__ == "__main__":
+    synthesis_benchmark()
+    plot_waveforms()